@@ -0,0 +1,60 @@
+# benchmarks/bench_coordinate_formats.py
+# Per-call cost of extract_coordinates and parse_coordinate before and after the
+# compiled format registry in utils/coordinate_utils.
+# Run from the repository root: python -m benchmarks.bench_coordinate_formats
+import re
+import timeit
+
+from benchmarks.bench_extract_coordinates import legacy_extract_coordinates
+from utils.coordinate_utils import extract_coordinates, parse_coordinate
+
+# Sample 2 from samples.txt
+NOTAM_TEXT = """AIRSPACE CLSD AS FLW:
+1. AREA: 562754N0613603E-562733N0613819E-562114N0615223E-
+         562259N0615347E-562212N0615550E-561911N0615235E-
+         562335N0614103E-562344N0611805E-562526N0612208E-
+         562520N0613420E-562754N0613603E
+   500M AMSL-950M AMSL.
+2. WI CIRCLE RADIUS 0.5KM CENTRE 562537N0613559E
+   SFC-900M AMSL.
+3. WI CIRCLE RADIUS 0.5KM CENTRE 562727N0613647E
+   SFC-900M AMSL."""
+
+def legacy_parse_coordinate(coord):
+    """parse_coordinate as it was before the registry: patterns looked up on every call."""
+    match = re.match(r'^(\d{2})(\d{2})(\d{2})([NS])(\d{3})(\d{2})(\d{2})([EW])$', coord)
+    if match:
+        lat = int(match.group(1)) + int(match.group(2)) / 60 + float(match.group(3)) / 3600
+        if match.group(4) == 'S':
+            lat = -lat
+        lon = int(match.group(5)) + int(match.group(6)) / 60 + float(match.group(7)) / 3600
+        if match.group(8) == 'W':
+            lon = -lon
+        return lat, lon
+    match = re.match(r'^(\d{2})(\d{2})([NS])(\d{3})(\d{2})([EW])$', coord)
+    if match:
+        lat = int(match.group(1)) + int(match.group(2)) / 60
+        if match.group(3) == 'S':
+            lat = -lat
+        lon = int(match.group(4)) + int(match.group(5)) / 60
+        if match.group(6) == 'W':
+            lon = -lon
+        return lat, lon
+    return None, None
+
+def per_call_us(func, *args, number=2_000):
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=5)) / number * 1e6
+
+def main():
+    cases = [
+        ("extract_coordinates (Sample 2)", legacy_extract_coordinates, extract_coordinates, NOTAM_TEXT),
+        ("parse_coordinate DDMMSS", legacy_parse_coordinate, parse_coordinate, "562754N0613603E"),
+        ("parse_coordinate DDMM", legacy_parse_coordinate, parse_coordinate, "5627N06136E"),
+    ]
+    for name, before, after, arg in cases:
+        before_us = per_call_us(before, arg)
+        after_us = per_call_us(after, arg)
+        print(f"{name:<32} before {before_us:8.2f} us, after {after_us:8.2f} us, x{before_us / after_us:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# benchmarks/bench_distances.py
+# Compares the batched distances_nm kernel with one geopy geodesic call per point,
+# as plot_airports used to filter the airports in its bounding box.
+# Run from the repository root: python -m benchmarks.bench_distances
+import timeit
+
+import numpy as np
+from geopy.distance import geodesic
+
+from utils.coordinate_utils import distances_nm
+
+def main():
+    rng = np.random.default_rng(0)
+    center_lat, center_lon = 56.9, 24.1
+    for n_points in (1_000, 10_000, 100_000):
+        lats = rng.uniform(center_lat - 25, center_lat + 25, n_points)
+        lons = rng.uniform(center_lon - 25, center_lon + 25, n_points)
+        ellipsoid = min(timeit.repeat(lambda: distances_nm(center_lat, center_lon, lats, lons), number=1, repeat=3))
+        sphere = min(timeit.repeat(
+            lambda: distances_nm(center_lat, center_lon, lats, lons, ellipsoid=False), number=1, repeat=3))
+        line = f"{n_points:>7} points: WGS84 {ellipsoid * 1000:8.2f} ms, haversine {sphere * 1000:7.2f} ms"
+        if n_points <= 10_000:
+            points = list(zip(lats.tolist(), lons.tolist()))
+            expected = [geodesic((center_lat, center_lon), point).nautical for point in points]
+            legacy = min(timeit.repeat(
+                lambda: [geodesic((center_lat, center_lon), point).nautical for point in points], number=1, repeat=1))
+            error = np.max(np.abs(distances_nm(center_lat, center_lon, lats, lons) - expected))
+            line += f", geopy loop {legacy * 1000:8.2f} ms (max difference {error * 1852 * 1000:.3f} mm)"
+        print(line)
+
+if __name__ == "__main__":
+    main()
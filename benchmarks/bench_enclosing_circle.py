@@ -0,0 +1,139 @@
+# benchmarks/bench_enclosing_circle.py
+# Checks the iterative Welzl enclosing circles against brute force over every circle
+# through two or three of the points, then times them at 10k and 100k points next to
+# the previous recursive version, which stops at Python's recursion limit.
+# Run from the repository root: python -m benchmarks.bench_enclosing_circle
+import math
+import random
+import sys
+import timeit
+from itertools import combinations
+
+import numpy as np
+
+from utils.coordinate_utils import (
+    _unit_vectors, angular_distances, enclosing_circle, spherical_enclosing_circle
+)
+
+def legacy_enclosing_circle(points):
+    """The recursive Welzl from drawing_utils before this change, without the geodesic radius."""
+    def distance_euclidean(p1, p2):
+        return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
+
+    def circle_two_points(p1, p2):
+        center = ((p1[0] + p2[0])/2, (p1[1] + p2[1])/2)
+        return (center[0], center[1], distance_euclidean(p1, center))
+
+    def circle_three_points(p1, p2, p3):
+        A = p2[0] - p1[0]
+        B = p2[1] - p1[1]
+        C = p3[0] - p1[0]
+        D = p3[1] - p1[1]
+        E = A*(p1[0] + p2[0]) + B*(p1[1] + p2[1])
+        F = C*(p1[0] + p3[0]) + D*(p1[1] + p3[1])
+        G = 2*(A*(p3[1] - p2[1]) - B*(p3[0] - p2[0]))
+        if G == 0:
+            return None
+        center_x = (D*E - B*F) / G
+        center_y = (A*F - C*E) / G
+        return (center_x, center_y, distance_euclidean(p1, (center_x, center_y)))
+
+    def welzl(P, R, n):
+        if n == 0 or len(R) == 3:
+            if len(R) == 0:
+                return (0, 0, 0)
+            elif len(R) == 1:
+                return (R[0][0], R[0][1], 0)
+            elif len(R) == 2:
+                return circle_two_points(R[0], R[1])
+            c = circle_three_points(R[0], R[1], R[2])
+            if c is not None:
+                return c
+            return max([circle_two_points(R[0], R[1]), circle_two_points(R[0], R[2]),
+                        circle_two_points(R[1], R[2])], key=lambda c: c[2])
+        p = P[n - 1]
+        c = welzl(P, R, n - 1)
+        if distance_euclidean(p, (c[0], c[1])) <= c[2] + 1e-8:
+            return c
+        return welzl(P, R + [p], n - 1)
+
+    P = list(set(points))
+    random.shuffle(P)
+    return welzl(P, [], len(P))
+
+def brute_force_planar_radius(lats, lons):
+    """Smallest circle through two or three points that holds them all: O(N^4)."""
+    # Work relative to the first point to keep the circumcentres accurate
+    points = np.column_stack((lats - lats[0], lons - lons[0]))
+    centers = [(a + b) / 2 for a, b in combinations(points, 2)]
+    for a, b, c in combinations(points, 3):
+        d = 2 * (a[0] * (b[1] - c[1]) + b[0] * (c[1] - a[1]) + c[0] * (a[1] - b[1]))
+        if d != 0:
+            aa, bb, cc = a @ a, b @ b, c @ c
+            centers.append(np.array([
+                (aa * (b[1] - c[1]) + bb * (c[1] - a[1]) + cc * (a[1] - b[1])) / d,
+                (aa * (c[0] - b[0]) + bb * (a[0] - c[0]) + cc * (b[0] - a[0])) / d,
+            ]))
+    return min(np.linalg.norm(points - center, axis=1).max() for center in centers)
+
+def brute_force_spherical_radius(lats, lons):
+    """Smallest cap whose centre is the midpoint of two points or the pole of three."""
+    points = _unit_vectors(lats, lons)
+    centers = [a + b for a, b in combinations(points, 2)]
+    for a, b, c in combinations(points, 3):
+        normal = np.cross(b - a, c - a)
+        if normal @ normal > 1e-30:
+            centers.append(normal if normal @ a > 0 else -normal)
+    radii = []
+    for center in centers:
+        center = center / np.linalg.norm(center)
+        chord = np.linalg.norm(points - center, axis=1).max()
+        radii.append(2 * math.asin(min(1.0, chord / 2)))
+    return min(radii)
+
+def random_points(n_points, rnd):
+    lat = rnd.uniform(-85, 85)
+    lon = rnd.uniform(-180, 180)
+    spread = rnd.choice([0.01, 1, 10])
+    lats = np.clip([lat + rnd.uniform(-spread, spread) for _ in range(n_points)], -89.9, 89.9)
+    lons = np.array([lon + rnd.uniform(-spread, spread) for _ in range(n_points)])
+    return lats, lons
+
+def check_against_brute_force(trials=300):
+    rnd = random.Random(0)
+    for _ in range(trials):
+        lats, lons = random_points(rnd.randrange(2, 9), rnd)
+        if rnd.random() < 0.3:
+            lats[1], lons[1] = lats[0], lons[0]  # Duplicate point
+
+        center_lat, center_lon, radius = enclosing_circle(lats, lons)
+        assert math.isclose(radius, brute_force_planar_radius(lats, lons), rel_tol=1e-7, abs_tol=1e-12)
+        assert np.hypot(lats - center_lat, lons - center_lon).max() <= radius * (1 + 1e-9)
+
+        center_lat, center_lon, radius = spherical_enclosing_circle(lats, lons)
+        assert math.isclose(radius, brute_force_spherical_radius(lats, lons), rel_tol=1e-7, abs_tol=1e-12)
+        assert angular_distances(center_lat, center_lon, lats, lons).max() <= radius * (1 + 1e-7) + 1e-12
+
+    # Three points spread around the equator do not fit in any hemisphere cap
+    assert spherical_enclosing_circle(np.array([0.0, 0.0, 0.0]), np.array([0.0, 120.0, -120.0])) is None
+    print(f"{trials} random point sets match brute force")
+
+def main():
+    check_against_brute_force()
+
+    rng = np.random.default_rng(1)
+    for n_points in (500, 10_000, 100_000):
+        lats, lons = rng.uniform(40, 70, n_points), rng.uniform(-10, 30, n_points)
+        planar = min(timeit.repeat(lambda: enclosing_circle(lats, lons), number=1, repeat=3))
+        spherical = min(timeit.repeat(lambda: spherical_enclosing_circle(lats, lons), number=1, repeat=3))
+        line = f"{n_points:>7} points: planar {planar * 1000:8.2f} ms, spherical {spherical * 1000:8.2f} ms"
+        points = list(zip(lats.tolist(), lons.tolist()))
+        try:
+            legacy = min(timeit.repeat(lambda: legacy_enclosing_circle(points), number=1, repeat=3))
+            line += f", recursive {legacy * 1000:8.2f} ms"
+        except RecursionError:
+            line += f", recursive fails (recursion limit {sys.getrecursionlimit()})"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_extract_coordinates.py
+# Compares the single-pass extract_coordinates with the previous pattern-by-pattern
+# extraction (findall per pattern, sub per pattern, findall per invalid pattern).
+# Run from the repository root: python -m benchmarks.bench_extract_coordinates
+import random
+import re
+import timeit
+
+from utils.coordinate_utils import (
+    COORDINATE_FORMATS,
+    INVALID_COORDINATE_FORMATS,
+    clean_coordinate_text,
+    extract_coordinates,
+)
+
+def legacy_format_coordinates(match):
+    """The tuple-length dispatch the legacy extraction used to build ICAO strings."""
+    if len(match) == 8 and match[0].isdigit():
+        return f"{match[0]}{match[1]}{match[2][:2]}{match[3]}{match[4]}{match[5]}{match[6][:2]}{match[7]}"
+    elif len(match) == 8 and match[0] in 'NS':
+        return f"{match[1]}{match[2]}{match[3][:2]}{match[0]}{match[5]}{match[6]}{match[7][:2]}{match[4]}"
+    elif len(match) == 6:
+        return f"{match[0]}{match[1]}{match[2]}{match[3]}{match[4]}{match[5]}"
+    elif len(match) == 7:
+        return f"{match[0]}{match[1]}{match[2]}{match[3]}{match[4]}{match[5]}{match[6]}"
+    elif len(match) == 10:
+        return f"{match[0]}{match[1]}{match[2]}{match[4]}{match[5]}{match[6]}{match[7]}{match[9]}"
+    elif len(match) == 12:
+        return f"{match[0]}{match[1]}{match[2]}{match[5]}{match[6]}{match[7]}{match[8]}{match[11]}"
+    return None
+
+def legacy_extract_coordinates(text):
+    """The multi-pass extraction that extract_coordinates replaced (36 scans per call)."""
+    patterns = [re.compile(f.regex) for f in COORDINATE_FORMATS]
+    invalid_patterns = [re.compile(f.regex) for f in INVALID_COORDINATE_FORMATS]
+    cleaned_text = clean_coordinate_text(text)
+    coords = []
+    invalid_coords = []
+    for pattern in patterns:
+        for match in pattern.findall(cleaned_text):
+            coord = legacy_format_coordinates(match)
+            if coord:
+                coords.append(coord)
+    suspect_coord = cleaned_text
+    for pattern in patterns:
+        suspect_coord = pattern.sub('', suspect_coord)
+    for pattern in invalid_patterns:
+        for match in pattern.findall(suspect_coord):
+            invalid_coord = legacy_format_coordinates(match)
+            if invalid_coord:
+                invalid_coords.append(invalid_coord)
+    return coords, invalid_coords
+
+def synthetic_notam(n_points, seed=0):
+    """Builds a route NOTAM with n_points coordinates in mixed formats, about 1% of them malformed."""
+    rnd = random.Random(seed)
+    points = []
+    for i in range(n_points):
+        lat = f"{rnd.randrange(90):02d}{rnd.randrange(60):02d}{rnd.randrange(60):02d}"
+        lon = f"{rnd.randrange(180):03d}{rnd.randrange(60):02d}{rnd.randrange(60):02d}"
+        kind = i % 4
+        if i % 100 == 99:
+            points.append(f"{lat[:5]}N{lon}E")  # one digit short
+        elif kind == 0:
+            points.append(f"{lat}N{lon}E")
+        elif kind == 1:
+            points.append(f"{lat}.{rnd.randrange(100):02d}S / {lon}.{rnd.randrange(100):02d}W")
+        elif kind == 2:
+            points.append(f"{lat[:4]}N {lon[:5]}E")
+        else:
+            points.append(f"N{lat}E{lon}")
+    lines = [" - ".join(points[i:i + 4]) for i in range(0, len(points), 4)]
+    return "UA ACT WILL TAKE PLACE ALONG THE PIPELINE FM :\n" + "\n".join(lines) + "\nSFC-900M AMSL."
+
+def main():
+    for n_points in (100, 1_000, 10_000):
+        text = synthetic_notam(n_points)
+        new_coords, new_invalid = extract_coordinates(text)
+        old_coords, old_invalid = legacy_extract_coordinates(text)
+        # The legacy extraction groups results by format; the scanner keeps text order
+        assert (sorted(new_coords), sorted(new_invalid)) == (sorted(old_coords), sorted(old_invalid)), "results differ"
+
+        repeat = max(1, 2_000 // n_points)
+        legacy = min(timeit.repeat(lambda: legacy_extract_coordinates(text), number=repeat, repeat=3)) / repeat
+        single = min(timeit.repeat(lambda: extract_coordinates(text), number=repeat, repeat=3)) / repeat
+        print(f"{n_points:>6} points: legacy {legacy * 1000:8.2f} ms, "
+              f"single-pass {single * 1000:8.2f} ms, speedup x{legacy / single:.1f}")
+
+if __name__ == "__main__":
+    main()
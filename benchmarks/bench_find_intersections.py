@@ -0,0 +1,38 @@
+# benchmarks/bench_find_intersections.py
+# Times the Bentley-Ottmann sweep in find_intersections on pasted-order polygons
+# with a few crossings, and checks it against the all-pairs test it replaces.
+# Run from the repository root: python -m benchmarks.bench_find_intersections
+import random
+import timeit
+
+from benchmarks.bench_sort_coordinates import random_coordinate_set
+from utils.coordinate_utils import _edges_cross, find_intersections, sort_coordinates
+
+def tangled_polygon(n_points, n_swaps, seed=0):
+    """A simple polygon through random points with n_swaps vertex pairs exchanged."""
+    points = sort_coordinates(random_coordinate_set(n_points, seed)).points()
+    rnd = random.Random(seed)
+    for _ in range(n_swaps):
+        i, j = rnd.randrange(len(points)), rnd.randrange(len(points))
+        points[i], points[j] = points[j], points[i]
+    return points
+
+def brute_force_intersections(points):
+    """Tests every pair of edges: O(N^2)."""
+    n = len(points)
+    return [(i, j) for i in range(n) for j in range(i + 1, n) if _edges_cross(points, i, j)]
+
+def main():
+    for n_points in (100, 1_000, 10_000):
+        points = tangled_polygon(n_points, n_swaps=5)
+        pairs = find_intersections(points)
+        seconds = min(timeit.repeat(lambda: find_intersections(points), number=1, repeat=3))
+        line = f"{n_points:>6} points, {len(pairs):>6} crossings: sweep {seconds * 1000:9.2f} ms"
+        if n_points <= 1_000:
+            assert brute_force_intersections(points) == pairs
+            brute = min(timeit.repeat(lambda: brute_force_intersections(points), number=1, repeat=1))
+            line += f", all pairs {brute * 1000:9.2f} ms"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# benchmarks/bench_great_circle_ring.py
+# Compares great_circle_ring with the previous loop of 360 geopy destination calls
+# per circle, for the radii the maps draw, and reports the largest position error.
+# Run from the repository root: python -m benchmarks.bench_great_circle_ring
+import timeit
+
+import numpy as np
+from geopy.distance import geodesic
+
+from utils.coordinate_utils import great_circle_ring
+
+def legacy_ring(lat, lon, radius_nm, n_points=360):
+    """One geopy geodesic destination per bearing, as plot_great_circle_circle did."""
+    lats, lons = [], []
+    for angle in np.linspace(0, 360, n_points):
+        destination = geodesic(kilometers=radius_nm * 1852 / 1000).destination((lat, lon), angle)
+        lats.append(destination.latitude)
+        lons.append(destination.longitude)
+    return lats, lons
+
+def max_error_m(lat, lon, radius_nm):
+    """Largest distance between the vectorised ring and geopy at the same 360 bearings."""
+    lats, lons = great_circle_ring(lat, lon, radius_nm, n_points=359)
+    expected_lats, expected_lons = legacy_ring(lat, lon, radius_nm)
+    return max(geodesic(a, b).meters for a, b in zip(zip(lats, lons), zip(expected_lats, expected_lons)))
+
+def main():
+    lat, lon = 56.9, 24.1
+    for radius_nm in (1, 5, 50, 400, 2000):
+        vectorised = min(timeit.repeat(lambda: great_circle_ring(lat, lon, radius_nm), number=10, repeat=3)) / 10
+        legacy = min(timeit.repeat(lambda: legacy_ring(lat, lon, radius_nm), number=1, repeat=3))
+        n_points = len(great_circle_ring(lat, lon, radius_nm)[0])
+        print(f"{radius_nm:>5} NM: {n_points:>3} points {vectorised * 1000:6.2f} ms, "
+              f"geopy loop {legacy * 1000:7.2f} ms, max error {max_error_m(lat, lon, radius_nm) * 1000:.3f} mm")
+
+if __name__ == "__main__":
+    main()
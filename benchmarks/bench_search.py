@@ -0,0 +1,68 @@
+# benchmarks/bench_search.py
+# Compares AbbreviationIndex.search with the per-sheet str.contains and iterrows scan
+# search_abbreviation used to run, on synthetic abbreviation workbooks of growing size,
+# and checks both return the same rows. The index matches literally, so the scan runs
+# with regex=False. Also reports the one-off index build time.
+# Run from the repository root: python -m benchmarks.bench_search
+import string
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from utils.search_utils import AbbreviationIndex
+
+WORDS = ("aerodrome", "approach", "runway", "taxiway", "control", "area", "flight", "information",
+         "region", "terminal", "restricted", "danger", "prohibited", "level", "altitude", "airway",
+         "route", "service", "traffic", "visual", "instrument", "procedure", "departure", "arrival")
+
+QUERIES = (("a", ""), ("rwy", ""), ("", "control"), ("tma", "terminal area"), ("", "flight information region"),
+           ("zzzq", "no such words"), ("a.", "(area"))
+
+def synthetic_workbook(n_rows, n_sheets=4, seed=0):
+    rng = np.random.default_rng(seed)
+    letters = np.array(list(string.ascii_uppercase))
+    sheets = {}
+    for sheet in range(n_sheets):
+        count = n_rows // n_sheets
+        abbrs = ["".join(rng.choice(letters, rng.integers(2, 6))) for _ in range(count)]
+        decoded = [" ".join(rng.choice(WORDS, rng.integers(2, 6))) for _ in range(count)]
+        sheets[f"SHEET{sheet}"] = pd.DataFrame({"ABBR": abbrs, "DECODED": decoded, "NOTE": range(count)})
+    return sheets
+
+def legacy_search(sheets, abbr_text, decoded_text):
+    results = []
+    abbr_text = abbr_text.lower()
+    decoded_text = decoded_text.lower()
+    for sheet_name, sheet_df in sheets.items():
+        if abbr_text:
+            matches = sheet_df[sheet_df.iloc[:, 0].astype(str).str.lower().str.contains(abbr_text, regex=False, na=False)]
+            results.extend((row.iloc[0], row.iloc[1], sheet_name) for _, row in matches.iterrows())
+        if decoded_text:
+            matches = sheet_df[sheet_df.iloc[:, 1].astype(str).str.lower().str.contains(decoded_text, regex=False, na=False)]
+            results.extend((row.iloc[0], row.iloc[1], sheet_name) for _, row in matches.iterrows())
+    return results
+
+def fresh_search(index, abbr_text, decoded_text):
+    # Forget the previous query, which would otherwise narrow a repeated one
+    index.reset()
+    return index.search(abbr_text, decoded_text)
+
+def main():
+    for n_rows in (2_000, 20_000, 100_000):
+        sheets = synthetic_workbook(n_rows)
+        build = min(timeit.repeat(lambda: AbbreviationIndex(sheets), number=1, repeat=1))
+        index = AbbreviationIndex(sheets)
+        print(f"{n_rows:>7} rows: index built in {build * 1000:.0f} ms")
+        for abbr_text, decoded_text in QUERIES:
+            hits = fresh_search(index, abbr_text, decoded_text)
+            legacy = legacy_search(sheets, abbr_text, decoded_text)
+            if hits != legacy:
+                raise AssertionError(f"Results differ for {abbr_text!r}, {decoded_text!r}")
+            indexed = min(timeit.repeat(lambda: fresh_search(index, abbr_text, decoded_text), number=1, repeat=5))
+            scan = min(timeit.repeat(lambda: legacy_search(sheets, abbr_text, decoded_text), number=1, repeat=1))
+            print(f"  {abbr_text!r:>6} {decoded_text!r:<29} {len(hits):>6} hits: "
+                  f"index {indexed * 1000:7.2f} ms, str.contains {scan * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_sort_coordinates.py
+# Checks that sort_coordinates (polar argsort plus the sweep-line simplicity check)
+# scales as N log N up to 100k points: the cost per N log2 N may drift with cache
+# effects but must stay within MAX_COST_DRIFT of the smallest size. Also compares
+# it with the previous sorted() + list.index() mapping, which is quadratic.
+# Run from the repository root: python -m benchmarks.bench_sort_coordinates
+import math
+import random
+import timeit
+from math import atan2
+
+from utils.coordinate_utils import CoordinateSet, sort_coordinates
+
+# A quadratic step would multiply the cost per N log2 N by ~10 from 10k to 100k points
+MAX_COST_DRIFT = 2.0
+
+def random_coordinate_set(n_points, seed=0):
+    rnd = random.Random(seed)
+    coords = [
+        f"{rnd.randrange(90):02d}{rnd.randrange(60):02d}{rnd.randrange(60):02d}{rnd.choice('NS')}"
+        f"{rnd.randrange(180):03d}{rnd.randrange(60):02d}{rnd.randrange(60):02d}{rnd.choice('EW')}"
+        for _ in range(n_points)
+    ]
+    return CoordinateSet.from_strings(coords)
+
+def legacy_sort_coordinates(coordinate_set):
+    """The polar sort before argsort: sorted() on tuples, then list.index() per point."""
+    parsed_coords = coordinate_set.points()
+    coords = coordinate_set.coords
+    centroid = (
+        sum(point[0] for point in parsed_coords) / len(parsed_coords),
+        sum(point[1] for point in parsed_coords) / len(parsed_coords)
+    )
+    sorted_points = sorted(parsed_coords, key=lambda point: atan2(point[1] - centroid[1], point[0] - centroid[0]))
+    sorted_coords = []
+    used_coords = set()
+    for point in sorted_points:
+        coord = coords[parsed_coords.index(point)]
+        if coord not in used_coords:
+            sorted_coords.append(coord)
+            used_coords.add(coord)
+    return sorted_coords
+
+def main():
+    costs = []
+    for n_points in (1_000, 10_000, 100_000):
+        coordinate_set = random_coordinate_set(n_points)
+        seconds = min(timeit.repeat(lambda: sort_coordinates(coordinate_set), number=1, repeat=3))
+        per_n_log_n = seconds / (n_points * math.log2(n_points)) * 1e9
+        costs.append(per_n_log_n)
+        line = f"{n_points:>7} points: sort_coordinates {seconds * 1000:9.2f} ms ({per_n_log_n:5.1f} ns per N log2 N)"
+        if n_points <= 10_000:
+            legacy = min(timeit.repeat(lambda: legacy_sort_coordinates(coordinate_set), number=1, repeat=1))
+            assert legacy_sort_coordinates(coordinate_set) == sort_coordinates(coordinate_set).coords
+            line += f", legacy {legacy * 1000:9.2f} ms"
+        print(line)
+    drift = max(costs) / min(costs)
+    print(f"cost per N log2 N varies by {drift:.2f}x (limit {MAX_COST_DRIFT}x)")
+    assert drift <= MAX_COST_DRIFT, "sort_coordinates no longer scales as N log N"
+
+if __name__ == "__main__":
+    main()
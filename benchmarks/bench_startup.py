@@ -0,0 +1,92 @@
+# benchmarks/bench_startup.py
+# Tracks cold start: the slowest imports behind "import gui" from python -X importtime,
+# whether the map and geospatial stack stays out of startup, and the time from
+# interpreter start to the first Tk mainloop tick of create_main_window.
+# Each measurement runs in a fresh interpreter, so nothing is cached in sys.modules.
+# Run from the repository root: python -m benchmarks.bench_startup
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+GEO_MODULES = ('matplotlib', 'geopandas', 'cartopy', 'osgeo', 'shapely', 'geopy', 'mplcursors', 'pyproj')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_GUI = f"""
+import sys
+import gui
+print(','.join(m for m in {GEO_MODULES!r} if m in sys.modules))
+"""
+
+# Replaces Tk's mainloop so the first idle tick prints the time and closes the window
+FIRST_TICK = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+mainloop = tk.Misc.mainloop
+def first_tick(self, n=0):
+    def done():
+        print(time.perf_counter() - start)
+        self.destroy()
+    self.after_idle(done)
+    mainloop(self, n)
+tk.Misc.mainloop = first_tick
+import gui
+gui.create_main_window()
+"""
+
+def run(*args):
+    return subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, text=True)
+
+def import_times(top=10):
+    """
+    Total cumulative microseconds of "import gui", the slowest root packages by the
+    summed self time of their modules, and the geospatial modules it loaded.
+    """
+    result = run('-X', 'importtime', '-c', IMPORT_GUI)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    total = 0
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name == 'gui':
+            total = int(cumulative)
+        root = name.split('.')[0]
+        packages[root] = packages.get(root, 0) + int(self_time)
+    loaded = [module for module in result.stdout.strip().split(',') if module]
+    return total, sorted(packages.items(), key=lambda item: -item[1])[:top], loaded
+
+def first_tick_times(repeat=5):
+    """Seconds to the first mainloop tick and whole process wall times, or None without a display."""
+    ticks, walls = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run('-c', FIRST_TICK)
+        walls.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            print(f"create_main_window could not run here: {result.stderr.strip().splitlines()[-1]}")
+            return None
+        ticks.append(float(result.stdout.strip().splitlines()[-1]))
+    return ticks, walls
+
+def main():
+    total, slowest, loaded = import_times()
+    print(f"import gui: {total / 1000:.1f} ms; slowest packages (own import time):")
+    for name, microseconds in slowest:
+        print(f"  {microseconds / 1000:8.1f} ms  {name}")
+    print(f"Geospatial modules loaded at startup: {', '.join(loaded) if loaded else 'none'}")
+
+    times = first_tick_times()
+    if times is not None:
+        ticks, walls = times
+        print(f"First mainloop tick: median {statistics.median(ticks) * 1000:.0f} ms, "
+              f"min {min(ticks) * 1000:.0f} ms (process wall time median {statistics.median(walls) * 1000:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,10 @@ from pathlib import Path
 
 # Import set_theme and theme definitions from theme_utils
 from utils.theme_utils import set_theme, DAY_THEME, NIGHT_THEME
+from utils.warmup_utils import WarmUp
 
 from views.home_view import show_home
-from views.ino_tool_view import show_ino_tool
+from views.ino_tool_view import show_ino_tool, preload_excel_data, use_preloaded_excel, preload_map, preload_map_tiles
 from views.notepad_view import show_notepad
 from views.todo_view import show_todo
 from views.templates_view import show_templates
@@ -79,6 +80,12 @@ def create_main_window():
     active_button = None
     current_view = None  # This will hold the function reference of the active view
 
+    # Parse the workbook and load the map stack on a worker thread while Home is shown
+    warmup = WarmUp(root)
+    warmup.add('excel', preload_excel_data, on_result=use_preloaded_excel)
+    warmup.add('map', preload_map)
+    warmup.add('map tiles', preload_map_tiles)
+
     # Define the theme toggle function BEFORE creating the theme_button
     def toggle_theme():
         nonlocal current_theme, config, current_view
@@ -179,11 +186,24 @@ def create_main_window():
 
     def show_ino_tool_view():
         nonlocal current_view
-        show_ino_tool(root, main_frame, current_theme)
+        if warmup.pending('excel'):
+            # Show a placeholder until the worker has parsed the workbook
+            for widget in main_frame.winfo_children():
+                widget.destroy()
+            root.title("EAD OPS Tool - INO OPS Tool")
+            tk.Label(main_frame, text="Loading abbreviation data...", font=("Arial", 11)).pack(pady=20)
+            warmup.when_ready('excel', resume_ino_tool_view)
+        else:
+            show_ino_tool(root, main_frame, current_theme)
         highlight_button(buttons['INO Tool'])
         set_theme(main_frame, current_theme)
         current_view = show_ino_tool_view  # Set current_view to this function
 
+    def resume_ino_tool_view():
+        # Only if the user is still waiting on the INO Tool placeholder
+        if current_view == show_ino_tool_view:
+            show_ino_tool_view()
+
     def show_notepad_view():
         nonlocal current_view
         show_notepad(root, main_frame, current_theme)
@@ -236,6 +256,9 @@ def create_main_window():
     # Show the home view by default and highlight the Home button
     show_home_view()
 
+    # Start warming up once Home has been drawn
+    root.after_idle(warmup.start)
+
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+# utils/canvas_utils.py
+import tkinter as tk
+import tkinter.font as tkFont
+from utils.coordinate_utils import as_coordinate_set
+
+def draw_coordinates(coords, canvas, current_theme, highlight_crossings=False):
+    """
+    Draws the closed polygon through coords on a Tk canvas with numbered points.
+    With highlight_crossings, edges that cross another edge are drawn in the
+    theme's crossing_color.
+    """
+    canvas.delete("all")
+    
+    if not coords:
+        return
+
+    # Reuse the parsed set; plain strings are parsed here and invalid ones dropped
+    coordinate_set = as_coordinate_set(coords)
+    
+    # Check if we have valid coordinates to plot
+    if not len(coordinate_set):
+        return
+    
+    # Unpack latitudes and longitudes
+    lats, lons = coordinate_set.lats.tolist(), coordinate_set.lons.tolist()
+    max_lat = max(lats)
+    min_lat = min(lats)
+    max_lon = max(lons)
+    min_lon = min(lons)
+
+    def transform(lat, lon):
+        lon_diff = max_lon - min_lon if max_lon != min_lon else 1e-5
+        lat_diff = max_lat - min_lat if max_lat != min_lat else 1e-5
+
+        # Ensure the points stay within canvas bounds
+        x = (lon - min_lon) / lon_diff * (canvas.winfo_width() - 20) + 10
+        y = (max_lat - lat) / lat_diff * (canvas.winfo_height() - 20) + 10
+
+        return x, y
+
+    # Define the font for the text
+    bold_font = tkFont.Font(family="Helvetica", size=12, weight="bold")
+
+    # Get colors from current_theme
+    point_fill_color = current_theme.get('point_fill_color', current_theme['point_fill_color']) 
+    line_color = current_theme.get('line_color', current_theme['line_color'])
+    text_color = current_theme.get('text_color', current_theme['canvas_fg'])
+    line_width = current_theme.get('line_width', current_theme['line_width'])
+    text_bg_color = current_theme.get('text_bg_color', current_theme['text_bg_color'])  
+    text_bg_outline_color = current_theme.get('text_bg_outline_color', current_theme['text_bg_outline_color'])
+
+    # Define radius for the point and text background circle
+    point_radius = 5  # Radius for the point
+    text_radius = 10  # Radius for the text background circle
+
+    # Edges that cross another edge; edge i runs from point i to point i + 1
+    crossing_edges = set()
+    if highlight_crossings:
+        crossing_edges = {edge for pair in coordinate_set.crossings() for edge in pair}
+    crossing_color = current_theme.get('crossing_color', line_color)
+
+    # Plot lines connecting points, closing the polygon back to the first point
+    for i in range(len(lats)):
+        x1, y1 = transform(lats[i], lons[i])
+        x2, y2 = transform(lats[(i + 1) % len(lats)], lons[(i + 1) % len(lats)])
+        if i in crossing_edges:
+            canvas.create_line(x1, y1, x2, y2, fill=crossing_color, width=line_width + 2)
+        else:
+            canvas.create_line(x1, y1, x2, y2, fill=line_color, width=line_width)
+
+    # Plot each point and its corresponding text with a background circle
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        x, y = transform(lat, lon)
+        
+        # Draw a filled circle behind the text
+        canvas.create_oval(
+            x - text_radius, y - text_radius,
+            x + text_radius, y + text_radius,
+            fill=text_bg_color,
+            outline=text_bg_outline_color,
+            width=2
+        )
+        
+        # Draw the text centered on the circle
+        canvas.create_text(
+            x, y,
+            text=str(i + 1),
+            anchor=tk.CENTER,  # Center the text on (x, y)
+            fill=text_color,
+            font=bold_font
+        )
@@ -1,8 +1,8 @@
 # utils/clipboard_utils.py
 import tkinter as tk
 from tkinter import messagebox
-from .coordinate_utils import extract_coordinates, sort_coordinates, trim_coordinates, coordinate_extremities
-from .drawing_utils import draw_coordinates
+from .coordinate_utils import extract_coordinates, sort_coordinates, trim_coordinates, coordinate_extremities, CoordinateSet
+from .canvas_utils import draw_coordinates
 
 # def show_copied_modal(root, parent_frame):
 #     modal = tk.Toplevel(root)
@@ -32,13 +32,15 @@ def paste_from_clipboard(
     
     coords, invalid_coords = extract_coordinates(clipboard_content)
 
-    if coords and len(coords) > 1:
-        sorted_coords = sort_coordinates(coords)
+    # Parse once; sorting, drawing and extremities all share these sets
+    original_set = CoordinateSet.from_strings(coords)
+    if len(original_set) > 1:
+        sorted_set = sort_coordinates(original_set)
     else:
-        sorted_coords = coords  # Use original coords if only one coordinate
+        sorted_set = original_set  # Use original coords if only one coordinate
 
-    # Pass sorted_coords to coordinate_extremities
-    extremities_str = coordinate_extremities(sorted_coords)
+    # Pass the sorted set to coordinate_extremities
+    extremities_str = coordinate_extremities(sorted_set)
     
     if original_text is not None:
         original_text.delete("1.0", tk.END)
@@ -58,22 +60,20 @@ def paste_from_clipboard(
             )
     
     if sorted_text is not None:
-        if coords and len(coords) > 1:
-            sorted_coords = sort_coordinates(coords)
-        else:
-            sorted_coords = trim_coordinates(coords)
+        if len(original_set) <= 1:
+            sorted_set = CoordinateSet.from_strings(trim_coordinates(coords))
 
         sorted_text.delete("1.0", tk.END)
-        sorted_text.insert(tk.END, "\n".join(sorted_coords))
+        sorted_text.insert(tk.END, "\n".join(sorted_set.coords))
 
     if original_canvas is not None:
-        draw_coordinates(coords, original_canvas, current_theme)
+        draw_coordinates(original_set, original_canvas, current_theme, highlight_crossings=True)
     if sorted_canvas is not None:
-        draw_coordinates(sorted_coords, sorted_canvas, current_theme)
+        draw_coordinates(sorted_set, sorted_canvas, current_theme, highlight_crossings=True)
     
     if invalid_coords:
         messagebox.showwarning(
             'Warning',
             'The following coordinates are invalid and were skipped:\n' + '\n'.join(invalid_coords)
         )
-    return extremities_str
\ No newline at end of file
+    return extremities_str, original_set, sorted_set
\ No newline at end of file
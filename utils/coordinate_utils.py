@@ -1,230 +1,324 @@
 # utils/coordinate_utils.py
 import re
+import time
+import heapq
+from bisect import bisect_left
+from collections import namedtuple
 from tkinter import messagebox
 import math
-from math import atan2
+import numpy as np
 
-def extract_coordinates(text):
+# Field layouts: the name of each regex group, in group order
+LAT_FIRST_DMS = ('lat_deg', 'lat_min', 'lat_sec', 'lat_dir', 'lon_deg', 'lon_min', 'lon_sec', 'lon_dir')
+LAT_FIRST_DM = ('lat_deg', 'lat_min', 'lat_dir', 'lon_deg', 'lon_min', 'lon_dir')
+HEMISPHERE_FIRST_DMS = ('lat_dir', 'lat_deg', 'lat_min', 'lat_sec', 'lon_dir', 'lon_deg', 'lon_min', 'lon_sec')
+
+def normalise_icao(fields):
+    """
+    Builds the ICAO string DDMM[SS]{N|S}DDDMM[SS]{E|W} from named fields.
+    Seconds are truncated to whole seconds; layouts without seconds give DDMM/DDDMM.
+    """
+    lat_sec = fields.get('lat_sec', '')[:2]
+    lon_sec = fields.get('lon_sec', '')[:2]
+    return (f"{fields['lat_deg']}{fields['lat_min']}{lat_sec}{fields['lat_dir']}"
+            f"{fields['lon_deg']}{fields['lon_min']}{lon_sec}{fields['lon_dir']}")
+
+def decode_icao(fields):
+    """
+    Converts named ICAO fields to decimal degrees (lat, lon).
+    """
+    lat = int(fields['lat_deg']) + int(fields['lat_min']) / 60 + float(fields.get('lat_sec', 0)) / 3600
+    if fields['lat_dir'] == 'S':
+        lat = -lat
+    lon = int(fields['lon_deg']) + int(fields['lon_min']) / 60 + float(fields.get('lon_sec', 0)) / 3600
+    if fields['lon_dir'] == 'W':
+        lon = -lon
+    return lat, lon
+
+# One entry of the format registry. regex is the format with positional groups,
+# pattern is the same regex compiled at import with each group named after its
+# field, and convert turns the dict of named fields into the entry's result.
+CoordinateFormat = namedtuple('CoordinateFormat', ['example', 'regex', 'pattern', 'fields', 'convert'])
+
+def _format(example, regex, fields, convert=normalise_icao):
+    """Creates a registry entry; the regex must have one group per field."""
+    names = iter(fields)
+    named_regex = re.sub(r'\((?!\?)', lambda _: f'(?P<{next(names)}>', regex)
+    return CoordinateFormat(example, regex, re.compile(named_regex), fields, convert)
+
+# Valid coordinate formats found in NOTAM text, normalised to ICAO strings
+COORDINATE_FORMATS = [
+    _format('123456.7N1234567.7E', r'(\d{2})(\d{2})(\d{2}\.\d{1})([NS])(\d{3})(\d{2})(\d{2}\.\d{1})([EW])', LAT_FIRST_DMS),
+    _format('123456.78N123456.78E', r'(\d{2})(\d{2})(\d{2}\.\d{2})([NS])(\d{3})(\d{2})(\d{2}\.\d{2})([EW])', LAT_FIRST_DMS),
+    _format('123456.789N123456.789E', r'(\d{2})(\d{2})(\d{2}\.\d{3})([NS])(\d{3})(\d{2})(\d{2}\.\d{3})([EW])', LAT_FIRST_DMS),
+    _format('123456.7890N123456.7890E', r'(\d{2})(\d{2})(\d{2}\.\d{4})([NS])(\d{3})(\d{2})(\d{2}\.\d{4})([EW])', LAT_FIRST_DMS),
+    _format('12345600N12345600E', r'(\d{2})(\d{2})(\d{2}\d{2})([NS])(\d{3})(\d{2})(\d{2}\d{2})([EW])', LAT_FIRST_DMS),
+    _format('123456N123456E', r'(\d{2})(\d{2})(\d{2})([NS])(\d{3})(\d{2})(\d{2})([EW])', LAT_FIRST_DMS),
+    _format('1234N12345E', r'(\d{2})(\d{2})([NS])(\d{3})(\d{2})([EW])', LAT_FIRST_DM),
+    _format('N123456E123456', r'([NS])(\d{2})(\d{2})(\d{2})([EW])(\d{3})(\d{2})(\d{2})', HEMISPHERE_FIRST_DMS),
+    _format('N123456.78E123456.78', r'([NS])(\d{2})(\d{2})(\d{2}\.\d{2})([EW])(\d{3})(\d{2})(\d{2}\.\d{2})', HEMISPHERE_FIRST_DMS),
+]
+
+# Coordinate-like formats with a missing digit, reported back as invalid
+INVALID_COORDINATE_FORMATS = [
+    _format('12345.7N1234567.7E', r'(\d{2})(\d{2})(\d{1}\.\d{1})([NS])(\d{3})(\d{2})(\d{2}\.\d{1})([EW])', LAT_FIRST_DMS),
+    _format('123456.7N123456.7E', r'(\d{2})(\d{2})(\d{2}\.\d{1})([NS])(\d{3})(\d{2})(\d{1}\.\d{1})([EW])', LAT_FIRST_DMS),
+    _format('12345.78N123456.78E', r'(\d{2})(\d{2})(\d{1}\.\d{2})([NS])(\d{3})(\d{2})(\d{2}\.\d{2})([EW])', LAT_FIRST_DMS),
+    _format('123456.78N12345.78E', r'(\d{2})(\d{2})(\d{2}\.\d{2})([NS])(\d{3})(\d{2})(\d{1}\.\d{2})([EW])', LAT_FIRST_DMS),
+    _format('12345.789N123456.789E', r'(\d{2})(\d{2})(\d{1}\.\d{3})([NS])(\d{3})(\d{2})(\d{2}\.\d{3})([EW])', LAT_FIRST_DMS),
+    _format('123456.789N12345.789E', r'(\d{2})(\d{2})(\d{2}\.\d{3})([NS])(\d{3})(\d{2})(\d{1}\.\d{3})([EW])', LAT_FIRST_DMS),
+    _format('12345.7890N123456.7890E', r'(\d{2})(\d{2})(\d{1}\.\d{4})([NS])(\d{3})(\d{2})(\d{2}\.\d{4})([EW])', LAT_FIRST_DMS),
+    _format('123456.7890N12345.7890E', r'(\d{2})(\d{2})(\d{2}\.\d{4})([NS])(\d{3})(\d{2})(\d{1}\.\d{4})([EW])', LAT_FIRST_DMS),
+    _format('1234560N12345600E', r'(\d{2})(\d{2})(\d{2}\d{1})([NS])(\d{3})(\d{2})(\d{2}\d{2})([EW])', LAT_FIRST_DMS),
+    _format('12345600N1234560E', r'(\d{2})(\d{2})(\d{2}\d{2})([NS])(\d{3})(\d{2})(\d{2}\d{1})([EW])', LAT_FIRST_DMS),
+    _format('12345N1234567E', r'(\d{2})(\d{2})(\d{1})([NS])(\d{3})(\d{2})(\d{2})([EW])', LAT_FIRST_DMS),
+    _format('123456N123456E', r'(\d{2})(\d{2})(\d{2})([NS])(\d{3})(\d{2})(\d{1})([EW])', LAT_FIRST_DMS),
+    _format('123N12345E', r'(\d{2})(\d{1})([NS])(\d{3})(\d{2})([EW])', LAT_FIRST_DM),
+    _format('1234N1234E', r'(\d{2})(\d{2})([NS])(\d{3})(\d{1})([EW])', LAT_FIRST_DM),
+    _format('N12345E123456', r'([NS])(\d{2})(\d{2})(\d{1})([EW])(\d{3})(\d{2})(\d{2})', HEMISPHERE_FIRST_DMS),
+    _format('N123456E12345', r'([NS])(\d{2})(\d{2})(\d{2})([EW])(\d{3})(\d{2})(\d{1})', HEMISPHERE_FIRST_DMS),
+    _format('N12345.78E1234567.78', r'([NS])(\d{2})(\d{2})(\d{1}\.\d{2})([EW])(\d{3})(\d{2})(\d{2}\.\d{2})', HEMISPHERE_FIRST_DMS),
+    _format('N123456.78E123456.78', r'([NS])(\d{2})(\d{2})(\d{2}\.\d{2})([EW])(\d{3})(\d{2})(\d{1}\.\d{2})', HEMISPHERE_FIRST_DMS),
+]
+
+# Normalised ICAO strings, decoded to decimal degrees by parse_coordinate
+ICAO_COORDINATE_FORMATS = [
+    _format('123456N1234567E', r'(\d{2})(\d{2})(\d{2})([NS])(\d{3})(\d{2})(\d{2})([EW])', LAT_FIRST_DMS, decode_icao),
+    _format('1234N12345E', r'(\d{2})(\d{2})([NS])(\d{3})(\d{2})([EW])', LAT_FIRST_DM, decode_icao),
+]
+
+def _build_scanner(valid_formats, invalid_formats):
+    """
+    Combines all coordinate formats into one alternation so the text is scanned once.
+    Valid formats come first, so they win over invalid ones starting at the same position.
+    Returns the compiled scanner and a map from the group number wrapping each
+    alternative to (is_valid, index, coordinate_format, field_groups).
+    """
+    alternatives = []
+    alternative_of_group = {}
+    group_offset = 0
+    for is_valid, format_list in ((True, valid_formats), (False, invalid_formats)):
+        for index, coordinate_format in enumerate(format_list):
+            alternatives.append(f'({coordinate_format.regex})')
+            group_count = len(coordinate_format.fields)
+            # The format's own groups follow the group wrapping the alternative
+            field_groups = tuple(range(group_offset + 2, group_offset + 2 + group_count))
+            alternative_of_group[group_offset + 1] = (is_valid, index, coordinate_format, field_groups)
+            group_offset += group_count + 1
+    # The lookahead lets the scanner skip positions no format can start at
+    return re.compile('(?=[0-9NS])(?:' + '|'.join(alternatives) + ')'), alternative_of_group
+
+_COORDINATE_SCANNER, _SCANNER_ALTERNATIVES = _build_scanner(COORDINATE_FORMATS, INVALID_COORDINATE_FORMATS)
+
+def clean_coordinate_text(text):
+    """
+    Strips separators and unit words that NOTAM originators put between coordinate fields.
+    """
+    return text.replace('\n', '').replace('\r', '').replace(' ', '').replace('/', '').replace(',', '.').replace('-', '').replace('DEG', '').replace('MIN', '').replace("'", '').replace('SEC', '')
+
+# A coordinate found by iter_coordinates; start and end are offsets into the cleaned text
+CoordinateMatch = namedtuple('CoordinateMatch', ['start', 'end', 'coord', 'is_valid', 'format_index'])
+
+def iter_coordinates(text):
+    """
+    Yields a CoordinateMatch for every valid and invalid coordinate in the text,
+    in the order they appear. The text is cleaned and scanned once; nothing is
+    collected, so callers can stop early or stream large inputs.
     """
-    Extracts coordinates from the given text using predefined regex patterns.
-    Additionally, identifies invalid coordinate-like patterns in the remaining text.
-    """
-    patterns = [
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{1})([NS])(\d{3})(\d{2})(\d{2}\.\d{1})([EW])'), # 123456.7N1234567.7E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{2})([NS])(\d{3})(\d{2})(\d{2}\.\d{2})([EW])'), # 123456.78N123456.78E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{3})([NS])(\d{3})(\d{2})(\d{2}\.\d{3})([EW])'), # 123456.789N123456.789E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{4})([NS])(\d{3})(\d{2})(\d{2}\.\d{4})([EW])'), # 123456.7890N123456.7890E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\d{2})([NS])(\d{3})(\d{2})(\d{2}\d{2})([EW])'), # 12345600N12345600E
-        re.compile(r'(\d{2})(\d{2})(\d{2})([NS])(\d{3})(\d{2})(\d{2})([EW])'), # 123456N123456E
-        re.compile(r'(\d{2})(\d{2})([NS])(\d{3})(\d{2})([EW])'), # 1234N12345E
-        re.compile(r'([NS])(\d{2})(\d{2})(\d{2})([EW])(\d{3})(\d{2})(\d{2})'), # N123456E123456
-        re.compile(r'([NS])(\d{2})(\d{2})(\d{2}\.\d{2})([EW])(\d{3})(\d{2})(\d{2}\.\d{2})') # N123456.78E123456.78
-    ]
-    # TODO: Add more patterns to match different coordinate formats
-    invalid_patterns = [
-        re.compile(r'(\d{2})(\d{2})(\d{1}\.\d{1})([NS])(\d{3})(\d{2})(\d{2}\.\d{1})([EW])'), # 12345.7N1234567.7E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{1})([NS])(\d{3})(\d{2})(\d{1}\.\d{1})([EW])'), # 123456.7N123456.7E
-        re.compile(r'(\d{2})(\d{2})(\d{1}\.\d{2})([NS])(\d{3})(\d{2})(\d{2}\.\d{2})([EW])'), # 12345.78N123456.78E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{2})([NS])(\d{3})(\d{2})(\d{1}\.\d{2})([EW])'), # 123456.78N12345.78E
-        re.compile(r'(\d{2})(\d{2})(\d{1}\.\d{3})([NS])(\d{3})(\d{2})(\d{2}\.\d{3})([EW])'), # 12345.789N123456.789E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{3})([NS])(\d{3})(\d{2})(\d{1}\.\d{3})([EW])'), # 123456.789N12345.789E
-        re.compile(r'(\d{2})(\d{2})(\d{1}\.\d{4})([NS])(\d{3})(\d{2})(\d{2}\.\d{4})([EW])'), # 12345.7890N123456.7890E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\.\d{4})([NS])(\d{3})(\d{2})(\d{1}\.\d{4})([EW])'), # 123456.7890N12345.7890E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\d{1})([NS])(\d{3})(\d{2})(\d{2}\d{2})([EW])'), # 1234560N12345600E
-        re.compile(r'(\d{2})(\d{2})(\d{2}\d{2})([NS])(\d{3})(\d{2})(\d{2}\d{1})([EW])'), # 12345600N1234560E
-        re.compile(r'(\d{2})(\d{2})(\d{1})([NS])(\d{3})(\d{2})(\d{2})([EW])'), # 12345N1234567E
-        re.compile(r'(\d{2})(\d{2})(\d{2})([NS])(\d{3})(\d{2})(\d{1})([EW])'), # 123456N123456E
-        re.compile(r'(\d{2})(\d{1})([NS])(\d{3})(\d{2})([EW])'), # 123N12345E
-        re.compile(r'(\d{2})(\d{2})([NS])(\d{3})(\d{1})([EW])'), # 1234N1234E
-        re.compile(r'([NS])(\d{2})(\d{2})(\d{1})([EW])(\d{3})(\d{2})(\d{2})'), # N12345E123456
-        re.compile(r'([NS])(\d{2})(\d{2})(\d{2})([EW])(\d{3})(\d{2})(\d{1})'), # N123456E12345
-        re.compile(r'([NS])(\d{2})(\d{2})(\d{1}\.\d{2})([EW])(\d{3})(\d{2})(\d{2}\.\d{2})'), # N12345.78E1234567.78
-        re.compile(r'([NS])(\d{2})(\d{2})(\d{2}\.\d{2})([EW])(\d{3})(\d{2})(\d{1}\.\d{2})') # N123456.78E123456.78
-    ]
-
-    # Clean the input text
-    cleaned_text = text.replace('\n', '').replace('\r', '').replace(' ', '').replace('/', '').replace(',', '.').replace('-', '').replace('DEG', '').replace('MIN', '').replace("'", '').replace('SEC', '')    
+    cleaned_text = clean_coordinate_text(text)
     #print('Cleaned Text:', cleaned_text)
+    for match in _COORDINATE_SCANNER.finditer(cleaned_text):
+        is_valid, index, coordinate_format, field_groups = _SCANNER_ALTERNATIVES[match.lastindex]
+        fields = dict(zip(coordinate_format.fields, match.group(*field_groups)))
+        coord = coordinate_format.convert(fields)
+        if coord:
+            yield CoordinateMatch(match.start(), match.end(), coord, is_valid, index)
+
+def extract_coordinates(text):
+    """
+    Extracts coordinates from the given text using the formats in COORDINATE_FORMATS.
+    Additionally, identifies invalid coordinate-like patterns (INVALID_COORDINATE_FORMATS).
+    Both lists keep the order in which the coordinates appear in the text.
+    """
     coords = []
     invalid_coords = []
-
-    # Extract valid coordinates using the predefined patterns - patterns
-    for pattern in patterns:
-        matches = pattern.findall(cleaned_text)
-        for match in matches:
-            coord = format_coordinates(match)
-            if coord:
-                coords.append(coord)
-    
-    # Remove all valid coordinate substrings from cleaned_text to get suspect_coord
-    suspect_coord = cleaned_text
-    for pattern in patterns:
-        suspect_coord = pattern.sub('', suspect_coord)
-    
-    # Check suspect_coord against invalid_patterns and collect invalid_coords
-    for pattern in invalid_patterns:
-        matches = pattern.findall(suspect_coord)
-        for match in matches:
-            invalid_coord = format_coordinates(match)
-            if invalid_coord:
-                invalid_coords.append(invalid_coord)
-                #print('Invalid Coordinates:', invalid_coords)
-    
-    return coords, invalid_coords
-
-def format_coordinates(match):
-    """
-    Formats the matched coordinate tuple into a standardized string.
-    """
-    try:
-        if len(match) == 8 and match[0].isdigit():
-            return f"{match[0]}{match[1]}{match[2][:2]}{match[3]}{match[4]}{match[5]}{match[6][:2]}{match[7]}"
-        elif len(match) == 8 and match[0] in 'NS':
-            return f"{match[1]}{match[2]}{match[3][:2]}{match[0]}{match[5]}{match[6]}{match[7][:2]}{match[4]}"
-        elif len(match) == 6:
-            return f"{match[0]}{match[1]}{match[2]}{match[3]}{match[4]}{match[5]}"
-        elif len(match) == 7:
-            return f"{match[0]}{match[1]}{match[2]}{match[3]}{match[4]}{match[5]}{match[6]}"
-        elif len(match) == 10:
-            return f"{match[0]}{match[1]}{match[2]}{match[4]}{match[5]}{match[6]}{match[7]}{match[9]}"
-        elif len(match) == 12:
-            return f"{match[0]}{match[1]}{match[2]}{match[5]}{match[6]}{match[7]}{match[8]}{match[11]}"
+    for match in iter_coordinates(text):
+        if match.is_valid:
+            coords.append(match.coord)
         else:
-            return None
-    except (IndexError, TypeError) as e:
-        messagebox.showwarning('Warning', f'Coordinate formatting error: {e}')
-        return None
+            invalid_coords.append(match.coord)
+    return coords, invalid_coords
 
 def parse_coordinate(coord):
     """
     Parses a coordinate string into latitude and longitude in decimal degrees.
-    Supports formats with and without seconds.
-    """
-    # Pattern with seconds: DDMMSSNDDDMMSSE
-    match = re.match(r'^(\d{2})(\d{2})(\d{2})([NS])(\d{3})(\d{2})(\d{2})([EW])$', coord)
-    if match:
-        lat_deg = int(match.group(1))
-        lat_min = int(match.group(2))
-        lat_sec = float(match.group(3))
-        lat_dir = match.group(4)
-        lon_deg = int(match.group(5))
-        lon_min = int(match.group(6))
-        lon_sec = float(match.group(7))
-        lon_dir = match.group(8)
-
-        lat = lat_deg + lat_min / 60 + lat_sec / 3600
-        if lat_dir == 'S':
-            lat = -lat
-
-        lon = lon_deg + lon_min / 60 + lon_sec / 3600
-        if lon_dir == 'W':
-            lon = -lon
-
-        #print(f"Parsed Coordinate: Latitude={lat}, Longitude={lon}")  # Debugging Statement
-        return lat, lon
-
-    # Pattern without seconds: DDMMNDDDMME
-    match = re.match(r'^(\d{2})(\d{2})([NS])(\d{3})(\d{2})([EW])$', coord)
-    if match:
-        lat_deg = int(match.group(1))
-        lat_min = int(match.group(2))
-        lat_dir = match.group(3)
-        lon_deg = int(match.group(4))
-        lon_min = int(match.group(5))
-        lon_dir = match.group(6)
-
-        lat = lat_deg + lat_min / 60
-        if lat_dir == 'S':
-            lat = -lat
-
-        lon = lon_deg + lon_min / 60
-        if lon_dir == 'W':
-            lon = -lon
-
-        #print(f"Parsed Coordinate: Latitude={lat}, Longitude={lon}")  # Debugging Statement
-        return lat, lon
+    Supports the ICAO formats in ICAO_COORDINATE_FORMATS (with and without seconds).
+    """
+    for coordinate_format in ICAO_COORDINATE_FORMATS:
+        match = coordinate_format.pattern.fullmatch(coord)
+        if match:
+            return coordinate_format.convert(match.groupdict())
 
     # If no pattern matches, show a warning
     messagebox.showwarning('Warning', f'Unrecognized coordinate format: {coord}')
     return None, None
 
-def convert_to_decimal(match):
-    """
-    Converts a regex match object to decimal latitude and longitude.
-    """
-    try:
-        if len(match.groups()) == 8:
-            lat_deg = int(match.group(1))
-            lat_min = int(match.group(2))
-            lat_sec = float(match.group(3))
-            lat_dir = match.group(4)
-            lon_deg = int(match.group(5))
-            lon_min = int(match.group(6))
-            lon_sec = float(match.group(7))
-            lon_dir = match.group(8)
-
-            lat = lat_deg + lat_min / 60 + lat_sec / 3600
-            if lat_dir == 'S':
-                lat = -lat
-            lon = lon_deg + lon_min / 60 + lon_sec / 3600
-            if lon_dir == 'W':
-                lon = -lon
-
-            return lat, lon
-        elif len(match.groups()) == 6:
-            lat_deg = int(match.group(1))
-            lat_min = int(match.group(2))
-            lat_dir = match.group(3)
-            lon_deg = int(match.group(4))
-            lon_min = int(match.group(5))
-            lon_dir = match.group(6)
-
-            lat = lat_deg + lat_min / 60
-            if lat_dir == 'S':
-                lat = -lat
-            lon = lon_deg + lon_min / 60
-            if lon_dir == 'W':
-                lon = -lon
-
-            return lat, lon
-    except (ValueError, TypeError) as e:
-        messagebox.showwarning('Warning', f'Coordinate conversion error: {e}')
-        return None, None
-
-def sort_coordinates(coords):
+def _icao_columns(coordinate_format):
     """
-    Sorts coordinates to form a simple polygon without intersections.
+    Column layout of a fixed-width ICAO format, read from the spans of its named
+    groups in its own example: per axis, the (start, stop) columns of degrees,
+    minutes and seconds (None without seconds), then the hemisphere column.
     """
-    # Parse the coordinates
-    parsed_coords = [parse_coordinate(coord) for coord in coords]
-    parsed_coords = [coord for coord in parsed_coords if coord != (None, None)]
+    match = coordinate_format.pattern.fullmatch(coordinate_format.example)
 
-    if not parsed_coords:
-        return []
+    def axis(prefix):
+        seconds = match.span(f'{prefix}_sec') if f'{prefix}_sec' in coordinate_format.fields else None
+        return match.span(f'{prefix}_deg'), match.span(f'{prefix}_min'), seconds, match.start(f'{prefix}_dir')
 
-    # Calculate the centroid
-    centroid = (
-        sum(point[0] for point in parsed_coords) / len(parsed_coords),
-        sum(point[1] for point in parsed_coords) / len(parsed_coords)
-    )
+    return axis('lat'), axis('lon')
+
+# ICAO_COORDINATE_FORMATS column layouts by string length, for parse_coordinates_array
+_ICAO_COLUMNS = {len(coordinate_format.example): _icao_columns(coordinate_format)
+                 for coordinate_format in ICAO_COORDINATE_FORMATS}
+
+def _decode_columns(chars, columns, positive, negative):
+    """
+    Decodes one axis of a (rows, width) uint8 character array to decimal degrees.
+    Returns the values and a mask of rows whose characters do not fit the layout.
+    """
+    (deg_start, deg_stop), (min_start, min_stop), seconds, hemisphere = columns
+    digit_stop = seconds[1] if seconds else min_stop
+    digits = chars[:, deg_start:digit_stop].astype(np.int64) - ord('0')
+    bad = ((digits < 0) | (digits > 9)).any(axis=1)
+
+    def number(start, stop):
+        place = 10 ** np.arange(stop - start - 1, -1, -1)
+        return digits[:, start - deg_start:stop - deg_start] @ place
+
+    values = number(deg_start, deg_stop) + number(min_start, min_stop) / 60
+    if seconds:
+        values = values + number(*seconds) / 3600
+    hemi = chars[:, hemisphere]
+    bad |= (hemi != ord(positive)) & (hemi != ord(negative))
+    return np.where(hemi == ord(negative), -values, values), bad
+
+def parse_coordinates_array(coords):
+    """
+    Parses ICAO coordinate strings (the ICAO_COORDINATE_FORMATS layouts) in bulk.
+    Returns an (N, 2) float array of (lat, lon) in decimal degrees, with NaN rows
+    for unrecognised strings, and a boolean mask that is True for those rows.
+    Never shows a message box; callers decide how to report invalid entries.
+    """
+    points = np.full((len(coords), 2), np.nan)
+    invalid = np.ones(len(coords), dtype=bool)
+    lengths = np.fromiter((len(coord) for coord in coords), dtype=np.int64, count=len(coords))
 
-    # Sort points by polar angle with respect to the centroid
-    sorted_points = sorted(parsed_coords, key=lambda point: atan2(point[1] - centroid[1], point[0] - centroid[0]))
-
-    # Map back to the original coordinates format
-    sorted_coords = []
-    used_coords = set()
-    for point in sorted_points:
-        try:
-            index = parsed_coords.index(point)
-            coord = coords[index]
-            if coord not in used_coords:
-                sorted_coords.append(coord)
-                used_coords.add(coord)
-        except ValueError:
+    for width, (lat_columns, lon_columns) in _ICAO_COLUMNS.items():
+        rows = np.flatnonzero(lengths == width)
+        if not rows.size:
             continue
+        # Non-ASCII characters become '?' so every string stays `width` bytes long
+        buffer = ''.join([coords[row] for row in rows]).encode('ascii', 'replace')
+        chars = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, width)
+        lats, bad_lat = _decode_columns(chars, lat_columns, 'N', 'S')
+        lons, bad_lon = _decode_columns(chars, lon_columns, 'E', 'W')
+        bad = bad_lat | bad_lon
+        points[rows[~bad], 0] = lats[~bad]
+        points[rows[~bad], 1] = lons[~bad]
+        invalid[rows] = bad
 
-    return sorted_coords
+    return points, invalid
+
+# ICAO_COORDINATE_FORMATS index by string width
+_ICAO_FORMAT_BY_WIDTH = {len(coordinate_format.example): index for index, coordinate_format in enumerate(ICAO_COORDINATE_FORMATS)}
+
+class CoordinateSet:
+    """
+    Coordinates parsed once and shared by sorting, drawing, mapping and extremities.
+    coords holds the ICAO strings, lats/lons the decimal degrees as NumPy arrays and
+    formats the ICAO_COORDINATE_FORMATS index of each string. Strings that could not
+    be parsed are kept in rejected so callers can report them. ordering is the
+    OrderingReport of the set returned by sort_coordinates, None otherwise.
+    """
+    __slots__ = ('coords', 'lats', 'lons', 'formats', 'rejected', 'ordering', '_crossings')
+
+    def __init__(self, coords, lats, lons, formats, rejected=(), ordering=None):
+        self.coords = coords
+        self.lats = lats
+        self.lons = lons
+        self.formats = formats
+        self.rejected = list(rejected)
+        self.ordering = ordering
+        self._crossings = None
+
+    @classmethod
+    def from_strings(cls, coords):
+        """Parses the strings once with parse_coordinates_array, dropping unrecognised ones."""
+        coords = list(coords)
+        points, invalid = parse_coordinates_array(coords)
+        valid_coords = [coord for coord, is_invalid in zip(coords, invalid) if not is_invalid]
+        rejected = [coord for coord, is_invalid in zip(coords, invalid) if is_invalid]
+        formats = np.array([_ICAO_FORMAT_BY_WIDTH[len(coord)] for coord in valid_coords], dtype=np.int8)
+        return cls(valid_coords, points[~invalid, 0], points[~invalid, 1], formats, rejected)
+
+    def take(self, indices):
+        """Returns a new set with the coordinates at the given indices, without re-parsing."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return CoordinateSet([self.coords[i] for i in indices.tolist()], self.lats[indices],
+                             self.lons[indices], self.formats[indices], self.rejected)
+
+    def points(self):
+        """Returns the coordinates as a list of (lat, lon) tuples of Python floats."""
+        return list(zip(self.lats.tolist(), self.lons.tolist()))
+
+    def crossings(self):
+        """Returns the crossing edge pairs of the polygon in this order, swept once per set."""
+        if self._crossings is None:
+            self._crossings = find_intersections(self.points())
+        return self._crossings
+
+    def __len__(self):
+        return len(self.coords)
+
+    def __iter__(self):
+        return iter(self.coords)
+
+def as_coordinate_set(coords):
+    """Returns coords unchanged if it is already a CoordinateSet, otherwise parses it once."""
+    if isinstance(coords, CoordinateSet):
+        return coords
+    return CoordinateSet.from_strings(coords)
+
+def polar_order(lats, lons):
+    """
+    Returns the permutation that orders points by polar angle around their centroid.
+    Points with the same angle keep their input order.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    if not lats.size:
+        return np.empty(0, dtype=np.intp)
+    angles = np.arctan2(lons - lons.mean(), lats - lats.mean())
+    return np.argsort(angles, kind='stable')
+
+def sort_coordinates(coords, drop_duplicates=True, strategies=None, time_budget=1.0):
+    """
+    Sorts coordinates to form a simple polygon without intersections.
+    Accepts a CoordinateSet (or a list of strings) and returns a CoordinateSet whose
+    ordering attribute reports the strategy used (see order_polygon).
+    With drop_duplicates, a coordinate string repeated in the input (e.g. the point
+    closing an area) is kept once, at its first position.
+    """
+    coordinate_set = as_coordinate_set(coords)
+
+    if drop_duplicates and len(coordinate_set):
+        _, first_seen = np.unique(np.asarray(coordinate_set.coords), return_index=True)
+        coordinate_set = coordinate_set.take(np.sort(first_seen))
+
+    order, report = order_polygon(coordinate_set.lats, coordinate_set.lons, strategies, time_budget)
+    sorted_set = coordinate_set.take(order)
+    sorted_set.ordering = report
+    return sorted_set
 
 # Existing convex hull function to compute the convex boundary for reference
 def convex_hull(points):
@@ -251,78 +345,674 @@ def convex_hull(points):
 
     return lower[:-1] + upper[:-1]
 
+def _orientation(a, b, c):
+    """Sign of the cross product (b - a) x (c - a): 1 left turn, -1 right turn, 0 collinear."""
+    value = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+    return (value > 0) - (value < 0)
+
+def _on_segment(a, b, p):
+    """True if p, known to be collinear with a and b, lies within the segment ab."""
+    return min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= p[1] <= max(a[1], b[1])
+
+def segments_intersect(a, b, c, d):
+    """True if the closed segments ab and cd share at least one point."""
+    o1 = _orientation(a, b, c)
+    o2 = _orientation(a, b, d)
+    o3 = _orientation(c, d, a)
+    o4 = _orientation(c, d, b)
+    if o1 != o2 and o3 != o4:
+        return True
+    return ((o1 == 0 and _on_segment(a, b, c)) or (o2 == 0 and _on_segment(a, b, d)) or
+            (o3 == 0 and _on_segment(c, d, a)) or (o4 == 0 and _on_segment(c, d, b)))
+
+def _edges_cross(points, i, j):
+    """
+    True if polygon edges i and j (edge k joins vertex k to vertex k + 1) intersect
+    anywhere other than the vertex that adjacent edges share.
+    """
+    n = len(points)
+    a, b = points[i], points[(i + 1) % n]
+    c, d = points[j], points[(j + 1) % n]
+    if (i + 1) % n == j:
+        # a-b-d: they only overlap if the path folds back along itself
+        return _orientation(a, b, d) == 0 and (_on_segment(a, b, d) and d != b or _on_segment(b, d, a) and a != b)
+    if (j + 1) % n == i:
+        return _orientation(c, d, b) == 0 and (_on_segment(c, d, b) and b != d or _on_segment(d, b, c) and c != d)
+    return segments_intersect(a, b, c, d)
+
+class _SweepStatus:
+    """
+    The edges on the sweep line, bottom to top, as a treap with one node per edge id
+    (-1 is no node). Insert and remove are O(log N) expected and nothing is shifted;
+    neighbours are found through the parent links, without comparing keys.
+    """
+    def __init__(self, n):
+        self.root = -1
+        self.left = [-1] * n
+        self.right = [-1] * n
+        self.parent = [-1] * n
+        self.priority = np.random.default_rng(0).random(n).tolist()
+
+    def _rotate_up(self, node):
+        """Rotates node above its parent, keeping the in-order sequence."""
+        left, right, parent = self.left, self.right, self.parent
+        above = parent[node]
+        grandparent = parent[above]
+        if left[above] == node:
+            child = right[node]
+            left[above], right[node] = child, above
+        else:
+            child = left[node]
+            right[above], left[node] = child, above
+        if child != -1:
+            parent[child] = above
+        parent[above], parent[node] = node, grandparent
+        if grandparent == -1:
+            self.root = node
+        elif left[grandparent] == above:
+            left[grandparent] = node
+        else:
+            right[grandparent] = node
+
+    def insert(self, i, key):
+        """Inserts edge i before the edges whose key is not below its own (like bisect_left)."""
+        target = key(i)
+        node, above, goes_left = self.root, -1, True
+        while node != -1:
+            above = node
+            goes_left = target <= key(node)
+            node = self.left[node] if goes_left else self.right[node]
+        self.parent[i] = above
+        if above == -1:
+            self.root = i
+        elif goes_left:
+            self.left[above] = i
+        else:
+            self.right[above] = i
+        priority = self.priority
+        while self.parent[i] != -1 and priority[i] > priority[self.parent[i]]:
+            self._rotate_up(i)
+
+    def remove(self, i):
+        left, right, priority = self.left, self.right, self.priority
+        # Rotate i down to a leaf, lifting its higher priority child each time
+        while left[i] != -1 or right[i] != -1:
+            if right[i] == -1 or (left[i] != -1 and priority[left[i]] > priority[right[i]]):
+                self._rotate_up(left[i])
+            else:
+                self._rotate_up(right[i])
+        above = self.parent[i]
+        if above == -1:
+            self.root = -1
+        elif left[above] == i:
+            left[above] = -1
+        else:
+            right[above] = -1
+        self.parent[i] = -1
+
+    def _neighbour(self, i, inner, outer):
+        # The next node on the `outer` side: the far end of that subtree, or the
+        # first ancestor reached from its `inner` side
+        if outer[i] != -1:
+            i = outer[i]
+            while inner[i] != -1:
+                i = inner[i]
+            return i
+        while self.parent[i] != -1 and outer[self.parent[i]] == i:
+            i = self.parent[i]
+        return self.parent[i]
+
+    def below(self, i):
+        """The edge just below edge i, or -1."""
+        return self._neighbour(i, self.right, self.left)
+
+    def above(self, i):
+        """The edge just above edge i, or -1."""
+        return self._neighbour(i, self.left, self.right)
+
+def find_crossing_edges(points):
+    """
+    Shamos-Hoey sweep over the closed polygon through points (lat, lon tuples).
+    Returns the indices (i, j), i < j, of two edges that cross or touch, or None if
+    the polygon is simple. Edge k joins vertex k to vertex k + 1 (the last one closes
+    the ring). Runs in O(N log N) expected time: the sweep status is a _SweepStatus.
+    """
+    n = len(points)
+    if n < 3:
+        return None
+
+    edges = []
+    events = []
+    for i in range(n):
+        a, b = points[i], points[(i + 1) % n]
+        left, right = (a, b) if a <= b else (b, a)
+        edges.append((left, right))
+        # At the same point, insertions (0) come before removals (1)
+        events.append((left, 0, i))
+        events.append((right, 1, i))
+    events.sort()
+
+    sweep_x = None
+
+    def sweep_key(i):
+        # Position of edge i on the sweep line, ties broken by slope
+        (x1, y1), (x2, y2) = edges[i]
+        if x1 == x2:
+            return (y1, math.inf)
+        slope = (y2 - y1) / (x2 - x1)
+        return (y1 + slope * (sweep_x - x1), slope)
+
+    def crossing(i, j):
+        if _edges_cross(points, i, j):
+            return (i, j) if i < j else (j, i)
+        return None
+
+    status = _SweepStatus(n)
+    for point, kind, i in events:
+        sweep_x = point[0]
+        if kind == 0:
+            status.insert(i, sweep_key)
+            for neighbour in (status.below(i), status.above(i)):
+                if neighbour != -1:
+                    found = crossing(i, neighbour)
+                    if found:
+                        return found
+        else:
+            below, above = status.below(i), status.above(i)
+            status.remove(i)
+            if below != -1 and above != -1:
+                found = crossing(below, above)
+                if found:
+                    return found
+    return None
+
+def _crossing_point(a, b, c, d):
+    """Point where segments ab and cd cross; for collinear overlaps, the start of the overlap."""
+    denominator = (b[0] - a[0]) * (d[1] - c[1]) - (b[1] - a[1]) * (d[0] - c[0])
+    if denominator == 0:
+        return max(min(a, b), min(c, d))
+    t = ((c[0] - a[0]) * (d[1] - c[1]) - (c[1] - a[1]) * (d[0] - c[0])) / denominator
+    return (a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1]))
+
+def find_intersections(points):
+    """
+    Bentley-Ottmann sweep over the closed polygon through points (lat, lon tuples).
+    Returns every pair (i, j), i < j, of edges that cross or touch, sorted; edge k
+    joins vertex k to vertex k + 1. Adjacent edges only count if they fold back
+    along each other. Runs in O((N + K) log N) for K reported pairs.
+    """
+    n = len(points)
+    if n < 3:
+        return []
+
+    edges = []
+    starts = {}
+    for i in range(n):
+        a, b = points[i], points[(i + 1) % n]
+        left, right = (a, b) if a <= b else (b, a)
+        edges.append((left, right))
+        starts.setdefault(left, []).append(i)
+    events = sorted(set(point for edge in edges for point in edge))
+    queued = set(events)
+    crossings = {}
+    sweep = events[0]
+
+    def sweep_y(i):
+        # Height of edge i on the sweep line; endpoints are returned exactly
+        (x1, y1), (x2, y2) = edges[i]
+        if x1 == x2:
+            return min(max(y1, sweep[1]), y2)
+        if sweep[0] == x1:
+            return y1
+        if sweep[0] == x2:
+            return y2
+        return y1 + (y2 - y1) * (sweep[0] - x1) / (x2 - x1)
+
+    def slope(i):
+        # Order just past a shared point; vertical edges run upwards, so go last
+        (x1, y1), (x2, y2) = edges[i]
+        return math.inf if x1 == x2 else (y2 - y1) / (x2 - x1)
+
+    found = set()
+    overlapping = {}
+
+    def check(i, j):
+        pair = (i, j) if i < j else (j, i)
+        if pair in found or not _edges_cross(points, i, j):
+            return
+        found.add(pair)
+        (a, b), (c, d) = edges[i], edges[j]
+        if a == b or c == d:
+            return  # repeated vertex: it meets the other edge at its own event point
+        if _orientation(a, b, c) == 0 and _orientation(a, b, d) == 0:
+            # Collinear overlap: the order never changes, but an edge crossing one
+            # of them crosses the other at the same point
+            overlapping.setdefault(i, set()).add(j)
+            overlapping.setdefault(j, set()).add(i)
+            return
+        point = _crossing_point(a, b, c, d)
+        if point > sweep:
+            crossings.setdefault(point, set()).update(pair)
+            if point not in queued:
+                queued.add(point)
+                heapq.heappush(events, point)
+
+    def passes_through(i, point, hinted):
+        a, b = edges[i]
+        return i in hinted or (_orientation(a, b, point) == 0 and _on_segment(a, b, point))
+
+    status = []
+    while events:
+        point = sweep = heapq.heappop(events)
+        hinted = crossings.pop(point, set())
+        pending = list(hinted)
+        while pending:
+            partners = overlapping.get(pending.pop(), set()) - hinted
+            hinted |= partners
+            pending.extend(partners)
+
+        # Block of status edges passing through the event point
+        low = bisect_left(status, point[1], key=sweep_y)
+        high = low
+        while low > 0 and passes_through(status[low - 1], point, hinted):
+            low -= 1
+        while high < len(status) and passes_through(status[high], point, hinted):
+            high += 1
+        for i in hinted:
+            if i in status:
+                position = status.index(i)
+                low, high = min(low, position), max(high, position + 1)
+
+        through = status[low:high]
+        started = starts.get(point, [])
+        meeting = through + started
+        for k, i in enumerate(meeting):
+            for j in meeting[k + 1:]:
+                check(i, j)
+
+        continuing = [i for i in meeting if edges[i][1] != point]
+        continuing.sort(key=slope)
+        status[low:high] = continuing
+        if continuing:
+            if low > 0:
+                check(status[low - 1], continuing[0])
+            end = low + len(continuing)
+            if end < len(status):
+                check(continuing[-1], status[end])
+        elif 0 < low < len(status):
+            check(status[low - 1], status[low])
+
+    return sorted(found)
+
+def is_simple_polygon(points):
+    """True if the closed polygon through points has no crossing or touching edges."""
+    return find_crossing_edges(points) is None
+
+def hull_insertion_order(lats, lons):
+    """
+    Orders points by starting from their convex hull and inserting every interior
+    point, farthest from the centroid first, where it lengthens the ring the least.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    n = lats.size
+    if n < 4:
+        return polar_order(lats, lons)
+
+    hull = convex_hull(list(zip(lats.tolist(), lons.tolist(), range(n))))
+    tour = [point[2] for point in hull]
+    inside = np.ones(n, dtype=bool)
+    inside[tour] = False
+    remaining = np.flatnonzero(inside)
+    distance = np.hypot(lats[remaining] - lats.mean(), lons[remaining] - lons.mean())
+
+    for r in remaining[np.argsort(-distance, kind='stable')].tolist():
+        ring = np.asarray(tour)
+        nxt = np.roll(ring, -1)
+        cost = (np.hypot(lats[ring] - lats[r], lons[ring] - lons[r]) +
+                np.hypot(lats[nxt] - lats[r], lons[nxt] - lons[r]) -
+                np.hypot(lats[ring] - lats[nxt], lons[ring] - lons[nxt]))
+        tour.insert(int(np.argmin(cost)) + 1, r)
+    return np.asarray(tour, dtype=np.intp)
+
+def untangle_two_opt(points, order, deadline=None, max_iterations=None):
+    """
+    Removes crossings with 2-opt moves: while find_crossing_edges reports edges i and j,
+    the path between them is reversed, which always shortens the ring.
+    Returns (order, is_simple, iterations); stops early at the deadline (perf_counter).
+    """
+    order = list(order)
+    n = len(order)
+    if max_iterations is None:
+        max_iterations = 10 * n + 10
+    for iteration in range(max_iterations):
+        ring = [points[k] for k in order]
+        found = find_crossing_edges(ring)
+        if found is None:
+            return np.asarray(order, dtype=np.intp), True, iteration
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        i, j = found
+        if j == i + 1 or (i == 0 and j == n - 1):
+            # Adjacent edges folding back on each other: move the shared vertex
+            shared = j if j == i + 1 else 0
+            before, after = (shared - 1) % n, (shared + 1) % n
+            if _on_segment(ring[before], ring[shared], ring[after]):
+                order[shared], order[after] = order[after], order[shared]
+            else:
+                order[shared], order[before] = order[before], order[shared]
+        else:
+            order[i + 1:j + 1] = order[i + 1:j + 1][::-1]
+    ring = [points[k] for k in order]
+    return np.asarray(order, dtype=np.intp), find_crossing_edges(ring) is None, max_iterations
+
+# Ordering strategies: name -> function(lats, lons) returning a permutation
+ORDERING_STRATEGIES = {
+    'polar': polar_order,
+    'hull_insertion': hull_insertion_order,
+}
+DEFAULT_ORDERING_STRATEGIES = ('polar', 'hull_insertion')
+
+# What order_polygon did: the strategy that produced the order ('+two_opt' when
+# crossings had to be untangled), whether the result is simple, and the time taken
+OrderingReport = namedtuple('OrderingReport', ['strategy', 'is_simple', 'seconds', 'iterations'])
+
+def order_polygon(lats, lons, strategies=None, time_budget=1.0):
+    """
+    Orders points into a simple (non-self-intersecting) polygon.
+    Tries each strategy in turn and keeps the first order that find_crossing_edges
+    accepts. If none is simple, the last one is untangled with 2-opt moves until it
+    is, or until time_budget seconds have passed.
+    Returns (permutation, OrderingReport).
+    """
+    start = time.perf_counter()
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    points = list(zip(lats.tolist(), lons.tolist()))
+    if strategies is None:
+        strategies = DEFAULT_ORDERING_STRATEGIES
+
+    order = np.arange(len(points), dtype=np.intp)
+    name = 'none'
+    for name in strategies:
+        order = ORDERING_STRATEGIES[name](lats, lons)
+        if is_simple_polygon([points[k] for k in order.tolist()]):
+            return order, OrderingReport(name, True, time.perf_counter() - start, 0)
+
+    order, is_simple, iterations = untangle_two_opt(points, order.tolist(), deadline=start + time_budget)
+    return order, OrderingReport(f'{name}+two_opt', is_simple, time.perf_counter() - start, iterations)
+
 # Coordinate extremities function to extract four corners of extreme coordinates and return as var extremities_text
+def _unit_vectors(lats, lons):
+    """(N, 3) unit vectors of points given in decimal degrees."""
+    lat, lon = np.radians(lats), np.radians(lons)
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+def angular_distances(lat, lon, lats, lons):
+    """Great-circle distances in radians from (lat, lon) to each of the points."""
+    chords = np.linalg.norm(_unit_vectors(lats, lons) - _unit_vectors([lat], [lon]), axis=1)
+    return 2 * np.arcsin(np.minimum(1.0, chords / 2))
+
+def _first_outside(points, start, stop, center, radius2):
+    """Index of the first of points[start:stop] outside the circle, or stop if none is."""
+    limit = radius2 * (1 + 1e-10) + 1e-18
+    # Scan in doubling blocks: in random order the next violation is usually close
+    block = 64
+    while start < stop:
+        end = min(stop, start + block)
+        offsets = points[start:end] - center
+        outside = np.flatnonzero(np.einsum('ij,ij->i', offsets, offsets) > limit)
+        if outside.size:
+            return start + int(outside[0])
+        start, block = end, block * 2
+    return stop
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+def _to_sphere(center):
+    """Projects a point in space onto the unit sphere."""
+    norm = math.sqrt(_dot(center, center))
+    if norm == 0:
+        return (math.nan, math.nan, math.nan)
+    return (center[0] / norm, center[1] / norm, center[2] / norm)
+
+def _circle_through(project, a, b, c=None):
+    """
+    Smallest circle with a and b (and c) on its boundary, as (center, radius squared).
+    Points are 3-D tuples; project maps the centre in space onto the surface.
+    """
+    if c is None:
+        center = project(((a[0] + b[0]) / 2, (a[1] + b[1]) / 2, (a[2] + b[2]) / 2))
+    else:
+        u = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+        v = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+        w = (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+        uu, vv, ww = _dot(u, u), _dot(v, v), _dot(w, w)
+        if ww <= 1e-30 * uu * vv:
+            # Collinear points: the circle over the two farthest apart
+            return max((_circle_through(project, p, q) for p, q in ((a, b), (a, c), (b, c))),
+                       key=lambda circle: circle[1])
+        # Circumcentre: a + ((|u|^2 v - |v|^2 u) x w) / (2 |w|^2)
+        t = (uu * v[0] - vv * u[0], uu * v[1] - vv * u[1], uu * v[2] - vv * u[2])
+        center = project((a[0] + (t[1] * w[2] - t[2] * w[1]) / (2 * ww),
+                          a[1] + (t[2] * w[0] - t[0] * w[2]) / (2 * ww),
+                          a[2] + (t[0] * w[1] - t[1] * w[0]) / (2 * ww)))
+    offset = (a[0] - center[0], a[1] - center[1], a[2] - center[2])
+    return center, _dot(offset, offset)
+
+def _welzl(points, project):
+    """
+    Welzl's minimal enclosing circle, written as three nested loops over a random
+    permutation instead of recursion. Each loop jumps to the next point outside the
+    current circle with one vectorised scan. Expected O(N).
+    """
+    points = points[np.random.default_rng().permutation(len(points))]
+    n = len(points)
+    center, radius2 = tuple(points[0].tolist()), 0.0
+    i = _first_outside(points, 1, n, center, radius2)
+    while i < n:
+        # points[i] lies on the boundary of the circle enclosing points[:i + 1]
+        p = tuple(points[i].tolist())
+        center, radius2 = p, 0.0
+        j = _first_outside(points, 0, i, center, radius2)
+        while j < i:
+            q = tuple(points[j].tolist())
+            center, radius2 = _circle_through(project, p, q)
+            k = _first_outside(points, 0, j, center, radius2)
+            while k < j:
+                center, radius2 = _circle_through(project, p, q, tuple(points[k].tolist()))
+                k = _first_outside(points, k + 1, j, center, radius2)
+            j = _first_outside(points, j + 1, i, center, radius2)
+        i = _first_outside(points, i + 1, n, center, radius2)
+    return center, radius2
+
+def enclosing_circle(lats, lons):
+    """
+    Minimal enclosing circle of the points in the flat lat/lon plane.
+    Returns (center_lat, center_lon, radius_degrees).
+    """
+    points = np.column_stack((lats, lons, np.zeros(len(lats))))
+    center, radius2 = _welzl(points, lambda center: center)
+    return float(center[0]), float(center[1]), math.sqrt(radius2)
+
+def spherical_enclosing_circle(lats, lons):
+    """
+    Smallest spherical cap holding the points: the true great-circle enclosing circle.
+    Returns (center_lat, center_lon, radius_radians), or None if the points do not fit
+    in a cap smaller than a hemisphere.
+    """
+    points = _unit_vectors(lats, lons)
+    with np.errstate(invalid='ignore'):
+        center, radius2 = _welzl(points, _to_sphere)
+        offsets = points - center
+        fits = (radius2 < 2 and all(map(math.isfinite, center))
+                and np.all(np.einsum('ij,ij->i', offsets, offsets) <= radius2 * (1 + 1e-9) + 1e-15))
+    if not fits:
+        return None
+    # Radius from the chord length to a boundary point
+    radius = 2 * math.asin(min(1.0, math.sqrt(radius2) / 2))
+    center_lat = math.degrees(math.asin(max(-1.0, min(1.0, center[2]))))
+    center_lon = math.degrees(math.atan2(center[1], center[0]))
+    return center_lat, center_lon, radius
+
+EARTH_RADIUS_NM = 3440.065  # Mean Earth radius
+WGS84_A = 6378137.0  # WGS84 semi-major axis in metres
+WGS84_F = 1 / 298.257223563  # WGS84 flattening
+METRES_PER_NM = 1852
+
+def destination_points(lat, lon, bearings, distance_nm, ellipsoid=True):
+    """
+    Points distance_nm from (lat, lon) along each of the bearings (degrees), in one
+    vectorised call. Solves the direct geodesic problem on the WGS84 ellipsoid with
+    Vincenty's iteration, or on a sphere of EARTH_RADIUS_NM with ellipsoid=False.
+    Returns (lats, lons) arrays in decimal degrees, longitudes within [-180, 180).
+    """
+    bearings = np.radians(np.asarray(bearings, dtype=float))
+    phi1, lambda1 = math.radians(lat), math.radians(lon)
+
+    if not ellipsoid:
+        delta = distance_nm / EARTH_RADIUS_NM
+        sin_phi2 = math.sin(phi1) * math.cos(delta) + math.cos(phi1) * math.sin(delta) * np.cos(bearings)
+        phi2 = np.arcsin(np.clip(sin_phi2, -1.0, 1.0))
+        lambda2 = lambda1 + np.arctan2(np.sin(bearings) * math.sin(delta) * math.cos(phi1),
+                                       math.cos(delta) - math.sin(phi1) * sin_phi2)
+    else:
+        a, f = WGS84_A, WGS84_F
+        b = (1 - f) * a
+        s = distance_nm * METRES_PER_NM
+        sin_alpha1, cos_alpha1 = np.sin(bearings), np.cos(bearings)
+        u1 = math.atan((1 - f) * math.tan(phi1))
+        sin_u1, cos_u1 = math.sin(u1), math.cos(u1)
+        sigma1 = np.arctan2(math.tan(u1), cos_alpha1)
+        sin_alpha = cos_u1 * sin_alpha1
+        cos2_alpha = 1 - sin_alpha ** 2
+        u2 = cos2_alpha * (a * a - b * b) / (b * b)
+        big_a = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+        big_b = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+
+        def delta_sigma(sigma):
+            cos_2sigma_m = np.cos(2 * sigma1 + sigma)
+            sin_sigma, cos_sigma = np.sin(sigma), np.cos(sigma)
+            return cos_2sigma_m, sin_sigma, cos_sigma, big_b * sin_sigma * (
+                cos_2sigma_m + big_b / 4 * (
+                    cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+                    - big_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)))
+
+        # Fixed-point iteration on the whole ring at once; converges in a few steps
+        sigma = s / (b * big_a)
+        for _ in range(100):
+            cos_2sigma_m, sin_sigma, cos_sigma, d_sigma = delta_sigma(sigma)
+            sigma, previous = s / (b * big_a) + d_sigma, sigma
+            if np.max(np.abs(sigma - previous)) < 1e-12:
+                break
+        cos_2sigma_m, sin_sigma, cos_sigma, _ = delta_sigma(sigma)
+
+        x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+        phi2 = np.arctan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+                          (1 - f) * np.sqrt(sin_alpha ** 2 + x ** 2))
+        lam = np.arctan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+        c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+        lambda2 = lambda1 + lam - (1 - c) * f * sin_alpha * (
+            sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)))
+
+    lons = (np.degrees(lambda2) + 180) % 360 - 180
+    return np.degrees(phi2), lons
+
+def distances_nm(lat, lon, lats, lons, ellipsoid=True):
+    """
+    Distances in nautical miles from (lat, lon) to each of the points, in one vectorised
+    call. Solves the inverse geodesic problem on the WGS84 ellipsoid with Vincenty's
+    iteration, or uses the haversine distance on a sphere with ellipsoid=False.
+    """
+    lats, lons = np.asarray(lats, dtype=float), np.asarray(lons, dtype=float)
+    if not ellipsoid:
+        return angular_distances(lat, lon, lats, lons) * EARTH_RADIUS_NM
+
+    a, f = WGS84_A, WGS84_F
+    b = (1 - f) * a
+    big_l = np.radians(lons - lon)
+    u1 = math.atan((1 - f) * math.tan(math.radians(lat)))
+    u2 = np.arctan((1 - f) * np.tan(np.radians(lats)))
+    sin_u1, cos_u1 = math.sin(u1), math.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lam = big_l
+        for _ in range(100):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            # Coincident points have sin_sigma == 0 and equatorial lines cos2_alpha == 0
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            cos_2sigma_m = np.where(cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+            c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            lam, previous = big_l + (1 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2))), lam
+            if np.nanmax(np.abs(lam - previous), initial=0.0) < 1e-12:
+                break
+
+    u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+    big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = big_b * sin_sigma * (cos_2sigma_m + big_b / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+        - big_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)))
+    distances = b * big_a * (sigma - delta_sigma) / METRES_PER_NM
+
+    # Vincenty does not converge for nearly antipodal points; use the sphere there
+    unresolved = ~np.isfinite(distances) | (np.abs(lam) > math.pi)
+    if unresolved.any():
+        distances[unresolved] = distances_nm(lat, lon, lats[unresolved], lons[unresolved], ellipsoid=False)
+    return distances
+
+def ring_vertex_count(radius_nm, tolerance_nm=0.05, min_points=32, max_points=360):
+    """
+    Vertices needed for a ring of radius_nm whose chords stray at most tolerance_nm
+    from the true circle, within [min_points, max_points].
+    """
+    if radius_nm <= tolerance_nm:
+        return min_points
+    n_points = math.ceil(math.pi / math.acos(1 - tolerance_nm / radius_nm))
+    return max(min_points, min(max_points, n_points))
+
+def great_circle_ring(lat, lon, radius_nm, n_points=None, ellipsoid=True):
+    """
+    Closed ring of points radius_nm from (lat, lon), as (lats, lons) arrays. The first
+    point is repeated at the end. n_points defaults to ring_vertex_count(radius_nm).
+    """
+    if n_points is None:
+        n_points = ring_vertex_count(radius_nm)
+    bearings = np.linspace(0, 360, n_points + 1)
+    return destination_points(lat, lon, bearings, radius_nm, ellipsoid=ellipsoid)
+
 def coordinate_extremities(coords):
     """
     Extracts the four corners of the extreme coordinates from sorted_coords
     and returns them as a formatted string.
+    Accepts a CoordinateSet (or a list of strings); the parsed arrays are reused.
     """
-    if not coords:
+    coordinate_set = as_coordinate_set(coords)
+    if not len(coordinate_set):
         return "No valid coordinates provided."
-    
-    # Initialize variables to store extremities
-    max_lat = None
-    min_lat = None
-    max_lon = None
-    min_lon = None
-
-    # Functions to parse latitude and longitude from coordinate string
-    def parse_lat(coord):
-        if len(coord) == 15:  # Format with seconds
-            lat_deg = int(coord[0:2])
-            lat_min = int(coord[2:4])
-            lat_sec = int(coord[4:6])
-            lat_dir = coord[6]
-            # Calculate a comparable value
-            lat_value = lat_deg * 10000 + lat_min * 100 + lat_sec
-        else:  # Format without seconds
-            lat_deg = int(coord[0:2])
-            lat_min = int(coord[2:4])
-            lat_dir = coord[4]
-            # Calculate a comparable value
-            lat_value = lat_deg * 10000 + lat_min * 100
-        if lat_dir == 'S':
-            lat_value = -lat_value
-        return lat_value, coord[:7] if len(coord) == 15 else coord[:5]  # Return value and original lat part
-
-    def parse_lon(coord):
-        if len(coord) == 15:  # Format with seconds
-            lon_deg = int(coord[7:10])
-            lon_min = int(coord[10:12])
-            lon_sec = int(coord[12:14])
-            lon_dir = coord[14]
-            # Calculate a comparable value
-            lon_value = lon_deg * 10000 + lon_min * 100 + lon_sec
-        else:  # Format without seconds
-            lon_deg = int(coord[5:8])
-            lon_min = int(coord[8:10])
-            lon_dir = coord[10]
-            # Calculate a comparable value
-            lon_value = lon_deg * 10000 + lon_min * 100
-        if lon_dir == 'W':
-            lon_value = -lon_value
-        return lon_value, coord[7:15] if len(coord) == 15 else coord[5:11]  # Return value and original lon part
-
-    # Iterate over all coordinates to find extremities
-    for coord in coords:
-        lat_value, lat_str = parse_lat(coord)
-        lon_value, lon_str = parse_lon(coord)
-
-        # Update max and min latitudes
-        if (max_lat is None) or (lat_value > max_lat):
-            max_lat = lat_value
-            max_lat_str = lat_str
-        if (min_lat is None) or (lat_value < min_lat):
-            min_lat = lat_value
-            min_lat_str = lat_str
-
-        # Update max and min longitudes
-        if (max_lon is None) or (lon_value > max_lon):
-            max_lon = lon_value
-            max_lon_str = lon_str
-        if (min_lon is None) or (lon_value < min_lon):
-            min_lon = lon_value
-            min_lon_str = lon_str
+
+    # The first extreme wins on ties, as with a strict comparison in a loop
+    max_lat_coord = coordinate_set.coords[int(np.argmax(coordinate_set.lats))]
+    min_lat_coord = coordinate_set.coords[int(np.argmin(coordinate_set.lats))]
+    max_lon_coord = coordinate_set.coords[int(np.argmax(coordinate_set.lons))]
+    min_lon_coord = coordinate_set.coords[int(np.argmin(coordinate_set.lons))]
+
+    # Latitude part is DDMMSS[N/S] or DDMM[N/S], the rest is the longitude part
+    def split_coord(coord):
+        lat_length = 7 if len(coord) == 15 else 5
+        return coord[:lat_length], coord[lat_length:]
+
+    max_lat_str = split_coord(max_lat_coord)[0]
+    min_lat_str = split_coord(min_lat_coord)[0]
+    max_lon_str = split_coord(max_lon_coord)[1]
+    min_lon_str = split_coord(min_lon_coord)[1]
 
     # Construct extremity coordinates
     northwest = f"{max_lat_str}{min_lon_str}"
@@ -387,7 +1077,7 @@ if __name__ == "__main__":
 
     # Sort coordinates
     sorted_coords = sort_coordinates(extracted_coords)
-    print('Sorted Coordinates:', sorted_coords)
+    print('Sorted Coordinates:', sorted_coords.coords)
 
     # Get extremities
     extremities_text = coordinate_extremities(sorted_coords)
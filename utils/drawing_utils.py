@@ -1,21 +1,32 @@
 # utils/drawing_utils.py
 import tkinter as tk
 from tkinter import messagebox
-import tkinter.font as tkFont
 import matplotlib
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from PIL import Image
 import geopandas as gpd
+import pandas as pd
 import cartopy.crs as ccrs
 from cartopy.crs import Geodetic
 from cartopy.crs import Globe
-from shapely.geometry import Point, box
+import shapely
+from shapely.geometry import box
 import numpy as np
+import math
 import sys
 import os
-from utils.coordinate_utils import parse_coordinate
+import queue
+import threading
+from utils.coordinate_utils import as_coordinate_set
 from utils.coordinate_utils import convex_hull
+from utils.coordinate_utils import angular_distances, enclosing_circle, spherical_enclosing_circle
+from utils.coordinate_utils import distances_nm, great_circle_ring
+from utils.file_utils import write_atomically
 from geopy.distance import geodesic
 import warnings
+from collections import OrderedDict
 from osgeo import gdal
 import mplcursors
 from matplotlib.patches import Patch
@@ -44,6 +55,14 @@ check_gdal_data()
 # Ensure we're using a font that can handle glyph 133 \x85 (ellipsis)
 matplotlib.rcParams['font.family'] = 'sans-serif'
 
+# Suppress only warnings that contain "glyph 133" or specific to \x85
+warnings.filterwarnings(
+    "ignore",
+    message=".*glyph 133.*",
+    category=UserWarning,
+    module="matplotlib"
+)
+
 active_cursors = []
 
 def get_resource_path(relative_path):
@@ -66,104 +85,77 @@ geodetic_spherical = ccrs.Geodetic(globe=spherical_globe)
 # Use Plate Carree projection with the spherical globe
 plate_carree_spherical = ccrs.PlateCarree(globe=spherical_globe)
 
-def minimal_enclosing_circle(points):
+def minimal_enclosing_circle(points, spherical=True):
     """
-    Computes the minimal enclosing circle using Welzl's algorithm with Euclidean distances.
+    Computes the minimal enclosing circle with an iterative Welzl algorithm.
+    By default this is the smallest great-circle cap holding the points; with
+    spherical=False it is the Euclidean circle in the lat/lon plane, which is
+    stretched east-west at high latitudes.
     :param points: List of tuples [(lat1, lon1), (lat2, lon2), ...]
     :return: (center_lat, center_lon, radius_nm)
     """
-    import math
-    import random
-    from geopy.distance import geodesic
-
-    def distance_euclidean(p1, p2):
-        return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
-
-    def circle_two_points(p1, p2):
-        center = ((p1[0] + p2[0])/2, (p1[1] + p2[1])/2)
-        radius = distance_euclidean(p1, center)
-        return (center[0], center[1], radius)
-
-    def circle_three_points(p1, p2, p3):
-        A = p2[0] - p1[0]
-        B = p2[1] - p1[1]
-        C = p3[0] - p1[0]
-        D = p3[1] - p1[1]
-        E = A*(p1[0] + p2[0]) + B*(p1[1] + p2[1])
-        F = C*(p1[0] + p3[0]) + D*(p1[1] + p3[1])
-        G = 2*(A*(p3[1] - p2[1]) - B*(p3[0] - p2[0]))
-        if G == 0:
-            return None  # Points are collinear
-        center_x = (D*E - B*F) / G
-        center_y = (A*F - C*E) / G
-        radius = distance_euclidean(p1, (center_x, center_y))
-        return (center_x, center_y, radius)
-
-    def is_inside(p, c):
-        return distance_euclidean(p, (c[0], c[1])) <= c[2] + 1e-8
-
-    def welzl(P, R, n):
-        if n == 0 or len(R) == 3:
-            if len(R) == 0:
-                return (0, 0, 0)
-            elif len(R) == 1:
-                return (R[0][0], R[0][1], 0)
-            elif len(R) == 2:
-                return circle_two_points(R[0], R[1])
-            elif len(R) == 3:
-                c = circle_three_points(R[0], R[1], R[2])
-                if c is not None:
-                    return c
-                else:
-                    # Collinear points, return the max two-point circle
-                    return max([
-                        circle_two_points(R[0], R[1]),
-                        circle_two_points(R[0], R[2]),
-                        circle_two_points(R[1], R[2])
-                    ], key=lambda c: c[2])
-        
-        p = P[n - 1]
-        c = welzl(P, R, n - 1)
-        if is_inside(p, c):
-            return c
-        else:
-            return welzl(P, R + [p], n - 1)
-
-    # Remove duplicate points
-    P = list(set(points))
-
-    if not P:
+    if len(points) == 0:
         return (0, 0, 0)
 
-    # Shuffle the points to ensure average-case performance
-    random.shuffle(P)
+    lats, lons = np.asarray(points, dtype=float).T
+    circle = spherical_enclosing_circle(lats, lons) if spherical else None
+    if circle is None:
+        # Planar mode, or points that do not fit in a hemisphere
+        circle = enclosing_circle(lats, lons)
+    center_lat, center_lon, _ = circle
 
-    # Compute the minimal enclosing circle
-    c = welzl(P, [], len(P))
+    # The geodesic radius only needs the points whose great-circle distance is
+    # close to the largest; WGS84 and spherical distances differ by under 0.5%
+    distances = angular_distances(center_lat, center_lon, lats, lons)
+    farthest = np.flatnonzero(distances >= distances.max() * 0.99)
+    radius_nm = max(geodesic((center_lat, center_lon), (lats[i], lons[i])).nautical for i in farthest)
 
-    # Extract center and initial radius
-    center_lat, center_lon, _ = c
+    return (center_lat, center_lon, radius_nm)
 
-    # Calculate the geodesic radius in nautical miles
-    max_dist = 0
-    for p in P:
-        try:
-            dist = geodesic((center_lat, center_lon), p).nautical
-            if dist > max_dist:
-                max_dist = dist
-        except Exception as e:
-            # print(f"Error calculating geodesic distance for point {p}: {e}")
-            continue
+LAYER_CACHE_DIR = "layer_cache"  # GeoParquet copies of the shapefiles, next to config.json
+# Held while layers, sidecars and airports are loaded: the warm-up worker and the Tk
+# thread share these caches, and a second caller waits for the first load to finish
+layer_lock = threading.RLock()
 
-    # Debugging Statements
-    # print(f"Computed Circle Center: Latitude={center_lat}, Longitude={center_lon}, Radius={max_dist} NM")
+def layer_sidecar_path(path, target_crs):
+    """GeoParquet file caching the shapefile at path reprojected to target_crs."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(LAYER_CACHE_DIR, f"{stem}.{target_crs.replace(':', '_')}.parquet")
 
-    return (center_lat, center_lon, max_dist)
+def shapefile_mtime(path):
+    """
+    Last change of a shapefile and its .dbf/.shx. Files bundled by PyInstaller are
+    unpacked fresh on every start, so they only change with the executable.
+    """
+    if getattr(sys, 'frozen', False):
+        return os.path.getmtime(sys.executable)
+    stem = os.path.splitext(path)[0]
+    return max(os.path.getmtime(stem + ext) for ext in ('.shp', '.dbf', '.shx') if os.path.exists(stem + ext))
+
+def read_layer_sidecar(sidecar, source_mtime):
+    """Reads a sidecar memory-mapped, or returns None if it is missing, older than the source or unreadable."""
+    if not os.path.exists(sidecar) or os.path.getmtime(sidecar) < source_mtime:
+        return None
+    try:
+        return gpd.read_parquet(sidecar, memory_map=True)
+    except Exception as e:
+        print(f"Could not read layer cache {sidecar}: {e}")
+        return None
+
+def write_layer_sidecar(gdf, sidecar):
+    """Writes the sidecar atomically so a partial write is never read back."""
+    try:
+        os.makedirs(os.path.dirname(sidecar), exist_ok=True)
+        write_atomically(sidecar, gdf.to_parquet)
+    except Exception as e:
+        print(f"Could not write layer cache {sidecar}: {e}")
 
 def load_shapefile(relative_path, target_crs="EPSG:4326"):
     """
     Load and reproject shapefile to WGS84 (EPSG:4326) by default.
     Handles both PyInstaller's bundled files and development paths.
+    Reads the GeoParquet sidecar in LAYER_CACHE_DIR when it is newer than the
+    shapefile; otherwise reads the shapefile and writes a fresh sidecar.
     """
     if getattr(sys, 'frozen', False):  # If bundled with PyInstaller
         base_path = sys._MEIPASS
@@ -173,15 +165,495 @@ def load_shapefile(relative_path, target_crs="EPSG:4326"):
     else:
         path = os.path.abspath(relative_path)  # Normal path during development
 
+    sidecar = layer_sidecar_path(path, target_crs)
+    gdf = read_layer_sidecar(sidecar, shapefile_mtime(path))
+    if gdf is not None:
+        return gdf
+
     gdf = gpd.read_file(path, engine="pyogrio")
     
     if gdf.crs is None:
         gdf = gdf.set_crs(target_crs)
     elif gdf.crs != target_crs:
         gdf = gdf.to_crs(target_crs)
+    write_layer_sidecar(gdf, sidecar)
     return gdf
 
+def build_layer_sidecars(directory='shapes', target_crs="EPSG:4326"):
+    """
+    Converts every shapefile in the bundled directory whose sidecar is missing or stale,
+    so the first map open reads GeoParquet. Run by the warm-up worker: a frozen build
+    validates sidecars against the executable's mtime, so they cannot ship with it.
+    """
+    for file_name in sorted(os.listdir(get_resource_path(directory))):
+        if not file_name.lower().endswith('.shp'):
+            continue
+        relative_path = os.path.join(directory, file_name)
+        path = get_resource_path(relative_path)
+        sidecar = layer_sidecar_path(path, target_crs)
+        with layer_lock:
+            if not os.path.exists(sidecar) or os.path.getmtime(sidecar) < shapefile_mtime(path):
+                load_shapefile(relative_path, target_crs=target_crs)
+
+class LayerCache:
+    """
+    Process-wide cache of loaded, reprojected shapefile layers keyed by (path, mtime, CRS).
+    Layers are read on first use; a changed file on disk gets a new key and is re-read.
+    Once the cached layers exceed max_bytes the least recently used are dropped.
+    Returned GeoDataFrames are shared, so callers must not modify them in place.
+    Safe to use from several threads: lookups and loads hold layer_lock.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._layers = OrderedDict()  # (path, mtime, crs) -> (gdf, size in bytes, {texts: MapLabels})
+
+    def load(self, relative_path, target_crs="EPSG:4326", bbox=None):
+        """
+        Returns the layer reprojected to target_crs, reading the shapefile only on a miss.
+        With bbox (min_x, min_y, max_x, max_y) only the features intersecting it are
+        returned, selected through the cached layer's spatial index.
+        """
+        return clip_to_bbox(self._entry(relative_path, target_crs)[0], bbox)
+
+    def labels(self, relative_path, texts, priority=None, target_crs="EPSG:4326"):
+        """
+        MapLabels for the whole layer, built on first use and kept with the cached layer.
+        texts (and optionally priority) map the layer's GeoDataFrame to one value per
+        feature; texts also names the label set, so pass a module-level function.
+        """
+        with layer_lock:
+            gdf, _, labels = self._entry(relative_path, target_crs)
+            if texts not in labels:
+                labels[texts] = MapLabels.from_layer(gdf, texts, priority)
+            return labels[texts]
+
+    def _entry(self, relative_path, target_crs):
+        with layer_lock:
+            path = get_resource_path(relative_path)
+            key = (path, os.path.getmtime(path), target_crs)
+            entry = self._layers.get(key)
+            if entry is not None:
+                self._layers.move_to_end(key)
+                return entry
+
+            gdf = load_shapefile(relative_path, target_crs=target_crs)
+            # Replace any copy of this layer read before the file changed
+            for stale in [k for k in self._layers if k[0] == path and k[2] == target_crs]:
+                self._discard(stale)
+            size = layer_size(gdf)
+            entry = self._layers[key] = (gdf, size, {})
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self._layers) > 1:
+                self._discard(next(iter(self._layers)))
+            return entry
+
+    def clear(self):
+        with layer_lock:
+            self._layers.clear()
+            self.total_bytes = 0
+
+    def _discard(self, key):
+        _, size, _ = self._layers.pop(key)
+        self.total_bytes -= size
+
+    def __len__(self):
+        return len(self._layers)
+
+def layer_size(gdf):
+    """Approximate memory held by a GeoDataFrame: attribute columns plus geometry coordinates."""
+    attributes = gdf.drop(columns=gdf.geometry.name).memory_usage(deep=True).sum()
+    coordinates = shapely.get_num_coordinates(gdf.geometry.values).sum()
+    return int(attributes + coordinates * 16 + len(gdf) * 100)  # 100 bytes per geometry object
+
+def clip_to_bbox(gdf, bbox):
+    """Features of gdf intersecting bbox (min_x, min_y, max_x, max_y), in file order; all of gdf if bbox is None."""
+    if bbox is None:
+        return gdf
+    return gdf.iloc[np.sort(gdf.sindex.query(box(*bbox)))]
+
+LABELS_PER_LAYER_AT_WORLD = 8  # Labels of one layer on screen at tile zoom 0, most prominent first
+MAX_LABELS_PER_LAYER = 80  # Cap once deeper zoom levels have doubled the budget enough
+
+def label_budget(zoom):
+    """Labels per layer at a tile zoom level: the budget doubles with every level zoomed in."""
+    return min(LABELS_PER_LAYER_AT_WORLD * 2 ** zoom, MAX_LABELS_PER_LAYER)
+
+class MapLabels:
+    """
+    Label anchors of one layer, computed once from the whole layer: polygon centroids
+    or point positions with their texts, ordered by priority (largest area first
+    unless a priority column is given) so culling keeps the most prominent labels.
+    """
+    def __init__(self, lons, lats, texts):
+        self.lons = lons
+        self.lats = lats
+        self.texts = texts
+
+    @classmethod
+    def from_layer(cls, gdf, texts, priority=None):
+        geometry = gdf.geometry.values
+        labelled = ~(shapely.is_missing(geometry) | shapely.is_empty(geometry))
+        texts = np.asarray(texts(gdf), dtype=object)
+        for text in texts[~labelled]:
+            print(f"Warning: Geometry is None or empty for label '{text}'")
+
+        centroids = shapely.centroid(geometry[labelled])
+        weights = shapely.area(geometry[labelled]) if priority is None else np.asarray(priority(gdf))[labelled]
+        order = np.argsort(-weights, kind='stable')
+        return cls(shapely.get_x(centroids)[order], shapely.get_y(centroids)[order], texts[labelled][order])
+
+    def visible(self, bbox, max_labels):
+        """Indices of at most max_labels labels inside bbox (min_lon, min_lat, max_lon, max_lat), by priority."""
+        min_lon, min_lat, max_lon, max_lat = bbox
+        inside = np.flatnonzero(
+            (self.lons >= min_lon) & (self.lons <= max_lon) & (self.lats >= min_lat) & (self.lats <= max_lat)
+        )
+        return inside[:max_labels]
+
+    def __len__(self):
+        return len(self.texts)
+
+layer_cache = LayerCache()
+
+def load_base_layers(bbox=None):
+    """Disputed areas, elevation points and FIRs intersecting bbox, in plot_base_map order."""
+    return (
+        layer_cache.load('shapes/ne_50m_admin_0_breakaway_disputed_areas.shp', target_crs="EPSG:4326", bbox=bbox),
+        layer_cache.load('shapes/ne_50m_geography_regions_elevation_points.shp', target_crs="EPSG:4326", bbox=bbox),
+        layer_cache.load('shapes/fir.shp', target_crs="EPSG:4326", bbox=bbox),
+    )
+
+TILE_SIZE = 256  # Pixels per tile side
+MAX_TILE_ZOOM = 12  # Level z covers the world in 4 * 2**z by 2 * 2**z tiles of 90 / 2**z degrees
+TILE_CACHE_DIR = os.path.join(LAYER_CACHE_DIR, "tiles")
+WORLD_BBOX = (-180, -90, 180, 90)
+PREBUILT_TILE_ZOOM = 3  # Levels the warm-up renders ahead, so a coarser tile always stands in
+TILE_POLL_MS = 250  # How often the map checks for tiles from the background renderer
+NOT_RENDERED = object()  # BaseMapTiles.stored for a tile neither in memory nor on disk
+
+def tile_zoom(extent, width_px):
+    """Coarsest pyramid level giving at least one tile pixel per screen pixel across the extent."""
+    degrees_per_px = (extent[1] - extent[0]) / width_px
+    if degrees_per_px <= 0:
+        return MAX_TILE_ZOOM
+    return min(max(math.ceil(math.log2(90 / TILE_SIZE / degrees_per_px)), 0), MAX_TILE_ZOOM)
+
+def tile_bounds(zoom, column, row):
+    """(min_lon, min_lat, max_lon, max_lat) of a tile; rows count down from the north pole."""
+    degrees = 90 / 2 ** zoom
+    return (-180 + column * degrees, 90 - (row + 1) * degrees, -180 + (column + 1) * degrees, 90 - row * degrees)
+
+def render_tile(bounds):
+    """
+    RGBA image of the FIR and disputed-area layers over bounds, drawn by plot_base_map
+    at screen resolution on a transparent background, or None if no feature is there.
+    """
+    disputed_areas_gdf, elevation_points_gdf, fir_gdf = load_base_layers(bounds)
+    if fir_gdf.empty and disputed_areas_gdf.empty:
+        return None
+
+    figure = Figure(figsize=(TILE_SIZE / 100, TILE_SIZE / 100), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    figure.patch.set_alpha(0)
+    ax = figure.add_axes([0, 0, 1, 1], projection=plate_carree_spherical)
+    ax.patch.set_visible(False)
+    ax.spines['geo'].set_visible(False)
+    plot_base_map(ax, disputed_areas_gdf, elevation_points_gdf, fir_gdf)
+    # GeoDataFrame.plot sets a latitude-dependent aspect; the tile must fill its box exactly
+    ax.set_aspect('auto')
+    min_lon, min_lat, max_lon, max_lat = bounds
+    ax.set_extent([min_lon, max_lon, min_lat, max_lat], crs=plate_carree_spherical)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+class BaseMapTiles:
+    """
+    Raster pyramid of the FIR and disputed-area layers, so maps composite a few images
+    instead of drawing every polygon. Tiles are saved as PNGs (or an empty marker where
+    there is no feature) under TILE_CACHE_DIR in a directory named after the layers'
+    mtime, so a changed shapefile starts a new pyramid; the most recently used tiles
+    stay in memory. The warm-up worker builds levels up to PREBUILT_TILE_ZOOM; deeper
+    tiles a map needs are rendered by a background thread, the map showing them cut
+    from the nearest coarser level meanwhile.
+    """
+    layer_paths = ('shapes/fir.shp', 'shapes/ne_50m_admin_0_breakaway_disputed_areas.shp')
+
+    def __init__(self, max_tiles=256):
+        self.max_tiles = max_tiles
+        self._tiles = OrderedDict()  # (directory, zoom, column, row) -> RGBA array or None
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()  # Tiles for the background renderer
+        self._queued = set()  # Tiles queued or being rendered
+        self._renderer = None
+
+    def directory(self):
+        version = max(shapefile_mtime(get_resource_path(path)) for path in self.layer_paths)
+        return os.path.join(TILE_CACHE_DIR, str(int(version)))
+
+    def _path(self, directory, zoom, column, row):
+        return os.path.join(directory, str(zoom), f"{column}_{row}.png")
+
+    def stored(self, zoom, column, row, directory):
+        """
+        A tile from memory or disk without rendering it: its RGBA array, None where the
+        layers have no feature, or NOT_RENDERED.
+        """
+        key = (directory, zoom, column, row)
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+
+        path = self._path(directory, zoom, column, row)
+        if os.path.exists(path):
+            try:
+                image = np.asarray(Image.open(path).convert('RGBA'))
+            except Exception as e:
+                print(f"Could not read map tile {path}: {e}")
+                return NOT_RENDERED
+        elif os.path.exists(os.path.splitext(path)[0] + ".empty"):
+            image = None
+        else:
+            return NOT_RENDERED
+        self._remember(key, image)
+        return image
+
+    def tile(self, zoom, column, row, directory=None):
+        """RGBA array of one tile, or None where the layers have no feature; rendered if need be."""
+        directory = directory or self.directory()
+        image = self.stored(zoom, column, row, directory)
+        if image is NOT_RENDERED:
+            image = render_tile(tile_bounds(zoom, column, row))
+            self._write(image, self._path(directory, zoom, column, row))
+            self._remember((directory, zoom, column, row), image)
+        return image
+
+    def _remember(self, key, image):
+        with self._lock:
+            self._tiles[key] = image
+            self._tiles.move_to_end(key)
+            if len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+
+    def _write(self, image, path):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if image is None:
+                open(os.path.splitext(path)[0] + ".empty", "wb").close()
+                return
+            write_atomically(path, lambda temporary: Image.fromarray(image).save(temporary, format='PNG'))
+        except Exception as e:
+            print(f"Could not write map tile {path}: {e}")
+
+    def _coarser(self, zoom, column, row, directory):
+        """The tile cut from the nearest coarser level already rendered and scaled up, or None."""
+        for level in range(zoom - 1, -1, -1):
+            shift = zoom - level
+            parent = self.stored(level, column >> shift, row >> shift, directory)
+            if parent is NOT_RENDERED:
+                continue
+            if parent is None:
+                return None
+            size = max(TILE_SIZE >> shift, 1)
+            x = (column - (column >> shift << shift)) * TILE_SIZE >> shift
+            y = (row - (row >> shift << shift)) * TILE_SIZE >> shift
+            piece = parent[y:y + size, x:x + size]
+            return np.repeat(np.repeat(piece, TILE_SIZE // size, axis=0), TILE_SIZE // size, axis=1)
+        return None
+
+    def request(self, zoom, column, row, directory):
+        """Queues a tile for the background renderer, started on first use."""
+        key = (directory, zoom, column, row)
+        with self._lock:
+            if key in self._queued:
+                return
+            self._queued.add(key)
+            if self._renderer is None:
+                self._renderer = threading.Thread(target=self._render_queued, name="map-tiles", daemon=True)
+                self._renderer.start()
+        self._queue.put(key)
+
+    def _render_queued(self):
+        while True:
+            directory, zoom, column, row = key = self._queue.get()
+            try:
+                self.tile(zoom, column, row, directory)
+            except Exception as e:
+                print(f"Could not render map tile {zoom}/{column}_{row}: {e}")
+                self._remember(key, None)
+            with self._lock:
+                self._queued.discard(key)
+
+    def pending(self):
+        """Number of tiles queued for or being rendered by the background renderer."""
+        with self._lock:
+            return len(self._queued)
+
+    def mosaic(self, bbox, zoom, render=True):
+        """
+        One RGBA image of the tiles covering bbox (min_lon, min_lat, max_lon, max_lat)
+        at zoom, with its extent [min_lon, max_lon, min_lat, max_lat] and the number of
+        tiles missing from it. With render=False tiles not rendered yet are requested
+        from the background renderer and cut from a coarser level instead.
+        """
+        degrees = 90 / 2 ** zoom
+        min_lon, min_lat, max_lon, max_lat = bbox
+        columns = range(max(int((min_lon + 180) // degrees), 0), min(int((max_lon + 180) // degrees), 4 * 2 ** zoom - 1) + 1)
+        rows = range(max(int((90 - max_lat) // degrees), 0), min(int((90 - min_lat) // degrees), 2 * 2 ** zoom - 1) + 1)
+
+        directory = self.directory()
+        image = np.zeros((len(rows) * TILE_SIZE, len(columns) * TILE_SIZE, 4), dtype=np.uint8)
+        missing = 0
+        for i, row in enumerate(rows):
+            for j, column in enumerate(columns):
+                if render:
+                    tile = self.tile(zoom, column, row, directory)
+                else:
+                    tile = self.stored(zoom, column, row, directory)
+                    if tile is NOT_RENDERED:
+                        self.request(zoom, column, row, directory)
+                        missing += 1
+                        tile = self._coarser(zoom, column, row, directory)
+                if tile is not None:
+                    image[i * TILE_SIZE:(i + 1) * TILE_SIZE, j * TILE_SIZE:(j + 1) * TILE_SIZE] = tile
+        west, _, _, north = tile_bounds(zoom, columns[0], rows[0])
+        _, south, east, _ = tile_bounds(zoom, columns[-1], rows[-1])
+        return image, [west, east, south, north], missing
+
+    def build(self, max_zoom=PREBUILT_TILE_ZOOM):
+        """Renders every tile down to max_zoom that is not on disk yet; run by the warm-up worker."""
+        directory = self.directory()
+        for zoom in range(max_zoom + 1):
+            for row in range(2 * 2 ** zoom):
+                for column in range(4 * 2 ** zoom):
+                    path = self._path(directory, zoom, column, row)
+                    if not os.path.exists(path) and not os.path.exists(os.path.splitext(path)[0] + ".empty"):
+                        self.tile(zoom, column, row, directory)
+
+base_map_tiles = BaseMapTiles()
+
+def plot_base_tiles(ax, extent, zoom):
+    """
+    Shows the base map tiles of level zoom as one image under everything else on the
+    axis, covering extent plus a tile on every side so short pans stay covered.
+    Never renders on the calling thread: returns the image and the number of tiles
+    still being rendered in the background, shown from a coarser level for now.
+    """
+    min_lon, max_lon, min_lat, max_lat = extent
+    margin = 90 / 2 ** zoom
+    bbox = (max(min_lon - margin, -180), max(min_lat - margin, -90),
+            min(max_lon + margin, 180), min(max_lat + margin, 90))
+    image, image_extent, missing = base_map_tiles.mosaic(bbox, zoom, render=False)
+    return ax.imshow(image, extent=image_extent, origin='upper', transform=plate_carree_spherical,
+                     interpolation='antialiased', aspect=ax.get_aspect(), zorder=0), missing
+
+def fir_label_texts(fir_gdf):
+    return fir_gdf['DESG'].astype(str).to_numpy()
+
+def disputed_area_label_texts(disputed_areas_gdf):
+    return disputed_areas_gdf['BRK_NAME'].astype(str).to_numpy()
+
+def elevation_label_texts(elevation_points_gdf):
+    return (elevation_points_gdf['name'].astype(str) + ' (' + elevation_points_gdf['elevation'].astype(str) + ' m)').to_numpy()
+
+def elevation_label_priority(elevation_points_gdf):
+    return pd.to_numeric(elevation_points_gdf['elevation'], errors='coerce').fillna(0).to_numpy()
+
+def load_base_labels():
+    """(MapLabels, text style) for the FIR, disputed area and elevation point layers."""
+    return [
+        (layer_cache.labels('shapes/fir.shp', fir_label_texts), dict(fontsize=8, color='black')),
+        (layer_cache.labels('shapes/ne_50m_admin_0_breakaway_disputed_areas.shp', disputed_area_label_texts),
+         dict(fontsize=8, color='red')),
+        (layer_cache.labels('shapes/ne_50m_geography_regions_elevation_points.shp', elevation_label_texts,
+                            elevation_label_priority), dict(fontsize=8, color='green')),
+    ]
+
+def add_map_labels(ax, label_layers, bbox, max_labels):
+    """
+    Attaches label layers to the axis and draws those in view. Labels are kept to
+    bbox, the area whose base layers were plotted, and re-culled by draw_map_labels.
+    """
+    ax.map_label_layers = label_layers
+    ax.map_label_bbox = bbox
+    ax.map_label_artists = getattr(ax, 'map_label_artists', [])
+    draw_map_labels(ax, max_labels)
+
+def draw_map_labels(ax, max_labels):
+    """
+    Replaces the axis' label artists with the labels inside its current extent, at most
+    max_labels per layer (see label_budget): zooming out thins them to the most
+    prominent features, zooming in brings back the rest.
+    """
+    for artist in ax.map_label_artists:
+        artist.remove()
+    x0, x1, y0, y1 = ax.get_extent(crs=plate_carree_spherical)
+    min_lon, min_lat, max_lon, max_lat = ax.map_label_bbox
+    view = (max(x0, min_lon), max(y0, min_lat), min(x1, max_lon), min(y1, max_lat))
+
+    artists = []
+    for labels, style in ax.map_label_layers:
+        for i in labels.visible(view, max_labels).tolist():
+            artists.append(ax.text(labels.lons[i], labels.lats[i], labels.texts[i],
+                                   transform=geodetic_spherical, **style))
+    ax.map_label_artists = artists
+
+class AirportStore:
+    """
+    World airports as WGS84 NumPy arrays, built once per file version.
+    lons/lats are float64, idents a fixed-width string array, names an object array
+    and types small integer codes into type_names. An STRtree over the points is
+    kept for the life of the store, so bounding-box lookups never touch the table.
+    """
+    def __init__(self, lons, lats, idents, names, type_codes, type_names):
+        self.lons = lons
+        self.lats = lats
+        self.idents = idents
+        self.names = names
+        self.type_codes = type_codes
+        self.type_names = type_names
+        self.tree = shapely.STRtree(shapely.points(lons, lats))
+
+    @classmethod
+    def from_layer(cls, airports_gdf):
+        """Builds the store from an airports layer in EPSG:4326, skipping non-point rows."""
+        geometry = airports_gdf.geometry.values
+        is_point = (shapely.get_type_id(geometry) == shapely.GeometryType.POINT) & ~shapely.is_empty(geometry)
+        airports_gdf = airports_gdf[is_point]
+        geometry = geometry[is_point]
+        types = airports_gdf['type'].astype(str).astype('category')
+        return cls(
+            shapely.get_x(geometry),
+            shapely.get_y(geometry),
+            airports_gdf['ident'].astype(str).to_numpy(dtype=str),
+            airports_gdf['name'].astype(str).to_numpy(dtype=object),
+            types.cat.codes.to_numpy(),
+            types.cat.categories.to_numpy(dtype=object),
+        )
+
+    def query_bbox(self, bounds):
+        """Indices of the airports inside bounds (min_lon, min_lat, max_lon, max_lat), in file order."""
+        return np.sort(self.tree.query(box(*bounds)))
+
+    def airport_type(self, i):
+        return self.type_names[self.type_codes[i]]
+
+    def __len__(self):
+        return len(self.lons)
 
+airport_stores = {}  # path -> (mtime, AirportStore)
+
+def load_airport_store(relative_path='shapes/world_airports.shp'):
+    """Returns the AirportStore for the shapefile, rebuilding it only when the file changes."""
+    path = get_resource_path(relative_path)
+    with layer_lock:
+        mtime = os.path.getmtime(path)
+        cached = airport_stores.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, AirportStore.from_layer(layer_cache.load(relative_path, target_crs="EPSG:4326")))
+            airport_stores[path] = cached
+        return cached[1]
 
 def decimal_degrees_to_dms(deg, is_lat=True):
     d = int(deg)
@@ -198,21 +670,9 @@ def format_coord(x, y):
     return f"Lat: {lat_dms}, Lon: {lon_dms}"
 
 def plot_great_circle_circle(ax, lon, lat, radius_nm, color, label):
-    n_points = 360
-    angles = np.linspace(0, 360, n_points)
-    lons = []
-    lats = []
-
-    for angle in angles:
-        bearing = np.radians(angle)
-        # Convert radius_nm to meters for accurate distance calculation
-        dist_m = radius_nm * 1852  # 1 NM = 1852 meters
-
-        # Use geodesic from geopy for accurate lat/lon points along the circle
-        destination = geodesic(kilometers=dist_m / 1000).destination((lat, lon), np.degrees(bearing))
-        lats.append(destination.latitude)
-        lons.append(destination.longitude)
-
+    """Draws the WGS84 geodesic circle of radius_nm around (lat, lon) as one dashed line."""
+    # Whole ring in one vectorised call; small circles get fewer vertices
+    lats, lons = great_circle_ring(lat, lon, radius_nm)
     ax.plot(lons, lats, color=color, linestyle='--', transform=Geodetic(), label=label)
 
 def plot_base_map(ax, disputed_areas_gdf, elevation_points_gdf, fir_gdf):
@@ -225,134 +685,326 @@ def plot_base_map(ax, disputed_areas_gdf, elevation_points_gdf, fir_gdf):
     #     ax.text(centroid.x, centroid.y, country['NAME'], fontsize=10, color='black', transform=geodetic_spherical)
 
     # Plot FIRs
-    fir_gdf.plot(ax=ax, edgecolor='black', facecolor='cyan', alpha=0.3, transform=ccrs.PlateCarree(), label="FIR Boundary")
+    if not fir_gdf.empty:
+        fir_gdf.plot(ax=ax, edgecolor='black', facecolor='cyan', alpha=0.3, transform=ccrs.PlateCarree(), label="FIR Boundary")
 
-    for idx, fir in fir_gdf.iterrows():
-        if fir.geometry is not None and not fir.geometry.is_empty:
-            centroid = fir.geometry.centroid
-            ax.text(centroid.x, centroid.y, fir['DESG'], fontsize=8, color='black', transform=geodetic_spherical)
-        else:
-            print(f"Warning: Geometry is None or empty for FIR with index {idx} and DESG '{fir['DESG']}'")
-    
+    # FIR, disputed area and elevation point names are drawn by add_map_labels
 
-    
     # Plot disputed areas
-    disputed_areas_gdf.plot(ax=ax, edgecolor='red', facecolor='none', linestyle='--', transform=geodetic_spherical, label="Disputed Areas")
-    
-    # Plot names of disputed areas
-    for _, disputed_area in disputed_areas_gdf.iterrows():
-        centroid = disputed_area.geometry.centroid
-        ax.text(centroid.x, centroid.y, disputed_area['BRK_NAME'], fontsize=8, color='red', transform=geodetic_spherical)
-    
-    # Plot elevation points
-    for _, elevation_point in elevation_points_gdf.iterrows():
-        point_lon, point_lat = elevation_point.geometry.x, elevation_point.geometry.y
-        name = elevation_point['name']
-        elevation = elevation_point['elevation']
-        elevation_text = f"{name} ({elevation} m)"
-        ax.text(point_lon, point_lat, elevation_text, fontsize=8, color='green', transform=geodetic_spherical)
-
-def plot_airports(ax, bounding_box, airports_gdf, center_lat, center_lon, max_distance_nm):
-    # Reproject airports to WGS84 (EPSG:4326) if needed
-    airports_gdf = airports_gdf.to_crs("EPSG:4326")
-
-    # Filter airports by bounding box
-    airports_within_bbox = airports_gdf.loc[airports_gdf.sindex.intersection(bounding_box.bounds)]
-    
-    markers = []
-    labels = []
-
-    for _, record in airports_within_bbox.iterrows():
-        airport_geometry = record.geometry
-        if isinstance(airport_geometry, Point):
-            airport_lon, airport_lat = airport_geometry.x, airport_geometry.y
-            
-            # Calculate the distance in NM between the center and each airport
-            distance_nm = geodesic((center_lat, center_lon), (airport_lat, airport_lon)).nautical
-            
-            # Plot only the airports within the max_distance_nm
-            if distance_nm <= max_distance_nm:
-                marker, = ax.plot(
-                    airport_lon,
-                    airport_lat,
-                    marker='*',
-                    markersize=6,
-                    linestyle='-',
-                    color='black',
-                    transform=Geodetic()  # Use the Geodetic transform for spherical plotting
-                )
-                markers.append(marker)
-                
-                # Store the airport label for the tooltip
-                airport_ident_name = (
-                    f"{record['ident']} - {record['name']}\n"
-                    f"{decimal_degrees_to_dms(airport_lat, True)}, "
-                    f"{decimal_degrees_to_dms(airport_lon, False)}\n"
-                    f"Type: {record['type']}\n"
-                )
-                labels.append(airport_ident_name)
-
-    cursor = mplcursors.cursor(markers, hover=False)
+    if not disputed_areas_gdf.empty:
+        disputed_areas_gdf.plot(ax=ax, edgecolor='red', facecolor='none', linestyle='--', transform=geodetic_spherical, label="Disputed Areas")
+
+def plot_airports(ax, bounding_box, airports, center_lat, center_lon, max_distance_nm):
+    """Marks the airports of an AirportStore within max_distance_nm of the centre."""
+    # Geodesic distance to every airport in the bounding box in one call
+    candidates = airports.query_bbox(bounding_box.bounds)
+    distances = distances_nm(center_lat, center_lon, airports.lats[candidates], airports.lons[candidates])
+    within = candidates[distances <= max_distance_nm]
+
+    # One artist for all airports; the picked index leads straight to the record
+    airport_markers = ax.scatter(
+        airports.lons[within],
+        airports.lats[within],
+        marker='*',
+        s=36,
+        color='black',
+        zorder=2,
+        transform=Geodetic()  # Use the Geodetic transform for spherical plotting
+    )
+
+    cursor = mplcursors.cursor(airport_markers, hover=False)
     @cursor.connect("add")
     def on_add(sel):
-        sel.annotation.set_text(labels[markers.index(sel.artist)])
+        i = within[sel.index]
+        airport_lat, airport_lon = airports.lats[i], airports.lons[i]
+        sel.annotation.set_text(
+            f"{airports.idents[i]} - {airports.names[i]}\n"
+            f"{decimal_degrees_to_dms(airport_lat, True)}, "
+            f"{decimal_degrees_to_dms(airport_lon, False)}\n"
+            f"Type: {airports.airport_type(i)}\n"
+        )
 
     ax.airports_cursor = cursor  # Attach cursor to the axis object
 
-def on_scroll(event):
-    """
-    Handles zooming in and out of the plot on scroll.
-    """
-    base_scale = 2.0  # Zoom factor
-    if event.button == 'up':
-        scale_factor = 1 / base_scale
-    elif event.button == 'down':
-        scale_factor = base_scale
-    else:
-        return
+ZOOM_STEP = 2.0  # Extent scale per wheel tick
+REDRAW_DELAY_MS = 150  # Wheel ticks closer together than this give one redraw
+PAN_THRESHOLD_PX = 3  # Mouse travel before a press becomes a drag
 
-    # Get the current extent
-    x0, x1, y0, y1 = event.inaxes.get_extent(crs=plate_carree_spherical)
+def zoom_extent(extent, scale_factor):
+    """Extent [min_lon, max_lon, min_lat, max_lat] scaled by scale_factor about its centre."""
+    x0, x1, y0, y1 = extent
     x_center = (x0 + x1) / 2
     y_center = (y0 + y1) / 2
     x_width = (x1 - x0) * scale_factor / 2
     y_height = (y1 - y0) * scale_factor / 2
-    new_extent = [x_center - x_width, x_center + x_width,
-                  y_center - y_height, y_center + y_height]
-    
-    # Set the new extent and redraw the plot
-    event.inaxes.set_extent(new_extent, crs=plate_carree_spherical)
-    plt.draw()
+    return [x_center - x_width, x_center + x_width, y_center - y_height, y_center + y_height]
+
+class MapWindow:
+    """
+    The map window reused by every "Show on map": a Matplotlib canvas in a Tk Toplevel
+    whose labels and gridlines stay in place. The FIR and disputed-area layers are one
+    image of base_map_tiles, recomposited when the zoom level changes or the view
+    leaves the area it covers; each show replaces only the overlay (coordinates,
+    circles, airports). Tiles still being rendered in the background are swapped in
+    when they are ready, polled every TILE_POLL_MS. Views set by the toolbar (pan, zoom, Home, Back, Forward) are
+    picked up from the axis limit callbacks once they settle for REDRAW_DELAY_MS.
+
+    Overlay artists are animated: every full render keeps a copy of the base map
+    without them, so a new overlay on the same view is blitted over that copy, a drag
+    pans the rendered map as a bitmap, and a burst of wheel ticks is applied as one
+    zoom and one render once the wheel stops.
+    """
+    def __init__(self):
+        self.window = tk.Toplevel()
+        self.window.title("EAD OPS Tool - Map")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.figure = Figure(figsize=(8, 8))
+        self.figure.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.1)
+        self.ax = self.figure.add_subplot(projection=plate_carree_spherical)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.window)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self.window)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+        self.canvas.mpl_connect('scroll_event', self.on_scroll)
+        self.canvas.mpl_connect('button_press_event', self.on_press)
+        self.canvas.mpl_connect('motion_notify_event', self.on_motion)
+        self.canvas.mpl_connect('button_release_event', self.on_release)
+        self.ax.callbacks.connect('xlim_changed', self.on_limits_changed)
+        self.ax.callbacks.connect('ylim_changed', self.on_limits_changed)
+
+        self.ax.format_coord = format_coord
+        self.ax.set_aspect('auto')
+
+        # Customize gridlines to have labels only on left and bottom
+        gl = self.ax.gridlines(draw_labels=True, linewidth=0.5, color='gray', alpha=0.5, linestyle='--')
+        gl.top_labels = False
+        gl.right_labels = False
+        gl.left_labels = True
+        gl.bottom_labels = True
+        gl.xlabel_style = {'size': 10, 'color': 'black'}
+        gl.ylabel_style = {'size': 10, 'color': 'black'}
+
+        self.extent = None
+        self.base_image = None
+        self.base_zoom = None
+        self.tiles_job = None  # Poll for background tiles missing from base_image
+        self.overlay_artists = []
+        self.background = None  # Last render without the overlay
+        self.frame = None  # Last render with the overlay
+        self.zoom_scale = 1.0
+        self.zoom_job = None
+        self.view_job = None
+        self.drag_start = None
+        self.panning = False
+
+    def show(self, extent, plot_overlay):
+        """
+        Shows extent [min_lon, max_lon, min_lat, max_lat] with the overlay drawn by
+        plot_overlay(ax) in place of the previous one, and raises the window.
+        """
+        ax = self.ax
+        for artist in self.overlay_artists:
+            artist.remove()
+        if getattr(ax, 'airports_cursor', None) is not None:
+            ax.airports_cursor.remove()
+            ax.airports_cursor = None
+        same_view = self.background is not None and list(extent) == self.extent
+        if not same_view:
+            self._set_view(extent)
+
+        before = set(ax.get_children())
+        plot_overlay(ax)
+        self.overlay_artists = [artist for artist in ax.get_children() if artist not in before]
+        for artist in self.overlay_artists:
+            artist.set_animated(True)
+
+        self.toolbar.update()  # The toolbar's Home view is this extent
+        if same_view:
+            self._blit_overlay()
+        else:
+            self.canvas.draw_idle()
+        self.window.deiconify()
+        self.window.lift()
+
+    def _set_view(self, extent, move=True):
+        """
+        Moves the map to extent (unless it is there already, move=False) with the base
+        map tiles and labels for it.
+        """
+        if move:
+            self.ax.set_extent(extent, crs=plate_carree_spherical)
+        self.extent = list(extent)
+        zoom = tile_zoom(extent, self.ax.bbox.width)
+        if self.base_image is None or zoom != self.base_zoom or not self._covered(extent):
+            self._replace_base_image(extent, zoom)
+        if hasattr(self.ax, 'map_label_layers'):
+            draw_map_labels(self.ax, label_budget(zoom))
+        else:
+            add_map_labels(self.ax, load_base_labels(), WORLD_BBOX, label_budget(zoom))
+
+    def _replace_base_image(self, extent, zoom):
+        if self.base_image is not None:
+            self.base_image.remove()
+        self.base_image, missing = plot_base_tiles(self.ax, extent, zoom)
+        self.base_zoom = zoom
+        if missing and self.tiles_job is None:
+            self.tiles_job = self.window.after(TILE_POLL_MS, self._poll_tiles)
+
+    def _poll_tiles(self):
+        """Recomposites the base image once the background renderer has caught up."""
+        self.tiles_job = None
+        if base_map_tiles.pending():
+            self.tiles_job = self.window.after(TILE_POLL_MS, self._poll_tiles)
+            return
+        self._replace_base_image(self.extent, tile_zoom(self.extent, self.ax.bbox.width))
+        self.canvas.draw_idle()
+
+    def _covered(self, extent):
+        """True if the current base image spans extent [min_lon, max_lon, min_lat, max_lat]."""
+        west, east, south, north = self.base_image.get_extent()
+        min_lon, max_lon, min_lat, max_lat = extent
+        return west <= min_lon and max_lon <= east and south <= min_lat and max_lat <= north
+
+    def on_limits_changed(self, ax):
+        """Refreshes tiles and labels once the limits stop changing, whoever changed them."""
+        if self.view_job is not None:
+            self.window.after_cancel(self.view_job)
+        self.view_job = self.window.after(REDRAW_DELAY_MS, self._refresh_view)
+
+    def _refresh_view(self):
+        self.view_job = None
+        extent = list(self.ax.get_extent(crs=plate_carree_spherical))
+        if self.extent is not None and np.allclose(extent, self.extent):
+            return  # Set by _set_view, which already brought tiles and labels up to date
+        self._set_view(extent, move=False)
+        self.canvas.draw_idle()
+
+    def on_draw(self, event):
+        """Completes every full render (on screen or saved) with the animated overlay."""
+        on_screen = event.canvas is self.canvas
+        if on_screen:
+            self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self.overlay_artists:
+            artist.draw(event.renderer)
+        if on_screen:
+            self.frame = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def _blit_overlay(self):
+        self.canvas.restore_region(self.background)
+        for artist in self.overlay_artists:
+            self.ax.draw_artist(artist)
+        self.frame = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.canvas.blit(self.figure.bbox)
+
+    def on_scroll(self, event):
+        """Collects wheel ticks and zooms once they stop for REDRAW_DELAY_MS."""
+        if event.inaxes is not self.ax:
+            return
+        if event.button == 'up':
+            self.zoom_scale /= ZOOM_STEP
+        elif event.button == 'down':
+            self.zoom_scale *= ZOOM_STEP
+        else:
+            return
+        if self.zoom_job is not None:
+            self.window.after_cancel(self.zoom_job)
+        self.zoom_job = self.window.after(REDRAW_DELAY_MS, self._apply_zoom)
+
+    def _apply_zoom(self):
+        self.zoom_job = None
+        scale_factor, self.zoom_scale = self.zoom_scale, 1.0
+        self._set_view(zoom_extent(self.ax.get_extent(crs=plate_carree_spherical), scale_factor))
+        self.canvas.draw_idle()
+
+    def on_press(self, event):
+        # Toolbar pan and zoom modes handle the mouse themselves
+        if event.button != 1 or event.inaxes is not self.ax or self.toolbar.mode or self.frame is None:
+            return
+        self.drag_start = (event.x, event.y)
+        self.panning = False
+
+    def on_motion(self, event):
+        """Drags the last render with the mouse without re-rendering the map."""
+        if self.drag_start is None:
+            return
+        dx, dy = event.x - self.drag_start[0], event.y - self.drag_start[1]
+        if not self.panning and max(abs(dx), abs(dy)) < PAN_THRESHOLD_PX:
+            return
+        self.panning = True
+
+        # Saved regions count rows from the top, events from the bottom
+        height = self.figure.bbox.height
+        x0, y0, x1, y1 = self.ax.bbox.extents
+        left, top, right, bottom = x0, height - y1, x1, height - y0
+        shift_x, shift_y = dx, -dy
+        source = (max(left, left - shift_x), max(top, top - shift_y),
+                  min(right, right - shift_x), min(bottom, bottom - shift_y))
+
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.ax.patch)
+        if source[0] < source[2] and source[1] < source[3]:
+            # xy places the saved figure's corner, so the map lands shifted by the drag
+            self.canvas.restore_region(self.frame, bbox=source, xy=(shift_x, shift_y))
+        self.canvas.blit(self.ax.bbox)
+
+    def on_release(self, event):
+        """Moves the map by the drag and renders it once."""
+        if self.drag_start is None:
+            return
+        start, self.drag_start = self.drag_start, None
+        if not self.panning:
+            return
+        self.panning = False
+
+        inverse = self.ax.transData.inverted()
+        (start_lon, start_lat), (end_lon, end_lat) = inverse.transform([start, (event.x, event.y)])
+        dlon, dlat = start_lon - end_lon, start_lat - end_lat
+        min_lon, max_lon, min_lat, max_lat = self.ax.get_extent(crs=plate_carree_spherical)
+        self._set_view([min_lon + dlon, max_lon + dlon, min_lat + dlat, max_lat + dlat])
+        self.canvas.draw_idle()
+
+    def close(self):
+        global map_window
+        map_window = None
+        for job in (self.zoom_job, self.view_job, self.tiles_job):
+            if job is not None:
+                self.window.after_cancel(job)
+        self.window.destroy()
+
+map_window = None
+
+def open_map_window():
+    """The open MapWindow, created on first use or after the user closed it."""
+    global map_window
+    if map_window is None:
+        map_window = MapWindow()
+    return map_window
+
+def warn_unrecognized_coordinates(*coordinate_sets):
+    """Shows one warning listing every coordinate that could not be parsed."""
+    unrecognized = [coord for coordinate_set in coordinate_sets for coord in coordinate_set.rejected]
+    if unrecognized:
+        messagebox.showwarning('Warning', 'Unrecognized coordinate format:\n' + '\n'.join(unrecognized))
 
 def plot_coordinates(original_coords, sorted_coords):
-    parsed_original_coords = [parse_coordinate(coord) for coord in original_coords]
-    parsed_original_coords = [coord for coord in parsed_original_coords if coord != (None, None)]
-    parsed_sorted_coords = [parse_coordinate(coord) for coord in sorted_coords]
-    parsed_sorted_coords = [coord for coord in parsed_sorted_coords if coord != (None, None)]
-    
-    original_lats, original_lons = zip(*parsed_original_coords)
-    sorted_lats, sorted_lons = zip(*parsed_sorted_coords)
+    original_set = as_coordinate_set(original_coords)
+    sorted_set = as_coordinate_set(sorted_coords)
+    warn_unrecognized_coordinates(original_set, sorted_set)
 
-    # Enable constrained_layout for automatic adjustment
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': plate_carree_spherical})
-    plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.1)
+    margin = 0.5  # Adjust margin as needed
+    min_lon, max_lon = original_set.lons.min() - margin, original_set.lons.max() + margin
+    min_lat, max_lat = original_set.lats.min() - margin, original_set.lats.max() + margin
+    extent = [float(min_lon), float(max_lon), float(min_lat), float(max_lat)]
 
-    
-    # Alternatively, if constrained_layout causes issues with Cartopy, use subplots_adjust
-    # fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': plate_carree_spherical})
-    # plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.1)
+    open_map_window().show(extent, lambda ax: plot_coordinates_overlay(ax, original_set, sorted_set, extent))
 
-    margin = 0.5  # Adjust margin as needed
-    min_lon, max_lon = min(original_lons) - margin, max(original_lons) + margin
-    min_lat, max_lat = min(original_lats) - margin, max(original_lats) + margin
-    ax.set_extent([min_lon, max_lon, min_lat, max_lat], crs=plate_carree_spherical)
+def plot_coordinates_overlay(ax, original_set, sorted_set, extent):
+    """Original and sorted polylines, their enclosing circle and the airports inside it."""
+    original_lats, original_lons = original_set.lats.tolist(), original_set.lons.tolist()
+    sorted_lats, sorted_lons = sorted_set.lats.tolist(), sorted_set.lons.tolist()
+    min_lon, max_lon, min_lat, max_lat = extent
 
-    # Load and plot base map layers
-    plot_base_map(ax, 
-                  load_shapefile('shapes/ne_50m_admin_0_breakaway_disputed_areas.shp', target_crs="EPSG:4326"),
-                  load_shapefile('shapes/ne_50m_geography_regions_elevation_points.shp', target_crs="EPSG:4326"),
-                  load_shapefile('shapes/fir.shp', target_crs="EPSG:4326"))
-    
     # Plot original and sorted coordinates
     for i, (lon, lat) in enumerate(zip(original_lons, original_lats)):
         ax.plot(lon, lat, marker='o', markersize=5, linestyle='-', color='blue', transform=Geodetic(), label='Original Coordinates' if i == 0 else "")
@@ -385,8 +1037,7 @@ def plot_coordinates(original_coords, sorted_coords):
     southeast = (max_lon + delta_deg, min_lat - delta_deg)
 
     bounding_box = box(*northwest, *southeast)
-    airports_gdf = load_shapefile('shapes/world_airports.shp', target_crs="EPSG:3857")
-    plot_airports(ax, bounding_box, airports_gdf, center_lat, center_lon, radius_nm)
+    plot_airports(ax, bounding_box, load_airport_store(), center_lat, center_lon, radius_nm)
 
     # Finalize plot with legend and interactive features
     legend_elements = [
@@ -401,29 +1052,7 @@ def plot_coordinates(original_coords, sorted_coords):
                markerfacecolor='black', markersize=6, linestyle='None')
     ]
     
-    fig.canvas.mpl_connect('scroll_event', on_scroll)
     ax.legend(handles=legend_elements, loc='upper right', fontsize='small')
-    
-    ax.format_coord = lambda x, y: format_coord(x, y)
-    
-    # Suppress only warnings that contain "glyph 133" or specific to \x85
-    warnings.filterwarnings(
-        "ignore",
-        message=".*glyph 133.*",
-        category=UserWarning,
-        module="matplotlib"
-    )
-
-    # Customize gridlines to have labels only on left and bottom
-    gl = ax.gridlines(draw_labels=True, linewidth=0.5, color='gray', alpha=0.5, linestyle='--')
-    gl.top_labels = False
-    gl.right_labels = False
-    gl.left_labels = True
-    gl.bottom_labels = True
-    gl.xlabel_style = {'size': 10, 'color': 'black'}
-    gl.ylabel_style = {'size': 10, 'color': 'black'}
-
-    ax.set_aspect('auto')
 
     # add title to the plot: "Original and Sorted Coordinates. Center: (lat, lon)."
     # formatted_lon = decimal_degrees_to_dms(lon, is_lat=False)
@@ -433,30 +1062,21 @@ def plot_coordinates(original_coords, sorted_coords):
     #     fontsize=12
     # )
 
-    plt.show()
-
 def show_single_coord_on_map(coord):
-    lat, lon = parse_coordinate(coord)
-    if lat is None or lon is None:
+    coordinate_set = as_coordinate_set([coord] if isinstance(coord, str) else coord)
+    if not len(coordinate_set):
         messagebox.showwarning('Warning', 'Invalid coordinate for plotting.')
         return
-
-    # Enable constrained_layout for automatic adjustment
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': plate_carree_spherical}, constrained_layout=True)
-    
-    # Alternatively, if constrained_layout causes issues with Cartopy, use subplots_adjust
-    # fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': plate_carree_spherical})
-    # plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.1)
+    coord = coordinate_set.coords[0]
+    lat, lon = coordinate_set.points()[0]
 
     extent_margin = 0.5  # Adjust margin as needed
-    ax.set_extent([lon - extent_margin, lon + extent_margin, lat - extent_margin, lat + extent_margin], crs=ccrs.PlateCarree())
+    extent = [lon - extent_margin, lon + extent_margin, lat - extent_margin, lat + extent_margin]
 
-    # Load shapefiles with target CRS as EPSG:4326 to match Plate Carree
-    plot_base_map(ax, 
-                  load_shapefile('shapes/ne_50m_admin_0_breakaway_disputed_areas.shp', target_crs="EPSG:4326"),
-                  load_shapefile('shapes/ne_50m_geography_regions_elevation_points.shp', target_crs="EPSG:4326"),
-                  load_shapefile('shapes/fir.shp', target_crs="EPSG:4326"))
+    open_map_window().show(extent, lambda ax: plot_single_coord_overlay(ax, coord, lat, lon))
 
+def plot_single_coord_overlay(ax, coord, lat, lon):
+    """The coordinate with its 1 NM and 5 NM circles and the airports within 30 NM."""
     # Plot the coordinate point
     ax.plot(lon, lat, marker='o', color='blue', markersize=8, transform=ccrs.PlateCarree(), label=f'{coord}')
     ax.text(lon, lat, f'{coord}', fontsize=10, color='blue', transform=ccrs.PlateCarree(), ha='left')
@@ -467,8 +1087,7 @@ def show_single_coord_on_map(coord):
 
     delta_deg = 5 * 1.852 / 110.574 + 5
     bounding_box = box(lon - delta_deg, lat - delta_deg, lon + delta_deg, lat + delta_deg)
-    airports_gdf = load_shapefile('shapes/world_airports.shp', target_crs="EPSG:3857")
-    plot_airports(ax, bounding_box, airports_gdf, lat, lon, 30)  # 10 + 20 = 30
+    plot_airports(ax, bounding_box, load_airport_store(), lat, lon, 30)  # 10 + 20 = 30
 
     # Finalize plot with legend and interactive features
     legend_elements = [
@@ -480,118 +1099,17 @@ def show_single_coord_on_map(coord):
         Line2D([0], [0], color='blue', linestyle='--', label='1NM Radius'),
         Line2D([0], [0], color='red', linestyle='--', label='5NM Radius')
     ]
-    
-    # Connect the scroll event to the handler
-    fig.canvas.mpl_connect('scroll_event', on_scroll)
 
     # Add custom legend
     ax.legend(handles=legend_elements, loc='upper right', fontsize='small')
-    
-    ax.format_coord = lambda x, y: format_coord(x, y)
-
-    # Suppress only warnings that contain "glyph 133" or specific to \x85
-    warnings.filterwarnings(
-        "ignore",
-        message=".*glyph 133.*",
-        category=UserWarning,
-        module="matplotlib"
-    )
-
-    # Customize gridlines to have labels only on left and bottom
-    gl = ax.gridlines(draw_labels=True, linewidth=0.5, color='gray', alpha=0.5, linestyle='--')
-    gl.top_labels = False
-    gl.right_labels = False
-    gl.left_labels = True
-    gl.bottom_labels = True
-    gl.xlabel_style = {'size': 10, 'color': 'black'}
-    gl.ylabel_style = {'size': 10, 'color': 'black'}
-
-    ax.set_aspect('auto')
-
-    plt.show()
-
 
 def show_on_map(original_coords, sorted_coords):
-    if len(original_coords) == 1:
-        show_single_coord_on_map(original_coords[0])
+    """
+    Opens the map for a CoordinateSet (or a list of strings) and its sorted order.
+    """
+    if len(original_coords) == 0:
+        messagebox.showwarning('Warning', 'No coordinates to show on map.')
+    elif len(original_coords) == 1:
+        show_single_coord_on_map(as_coordinate_set(original_coords))
     else:
         plot_coordinates(original_coords, sorted_coords)
-
-def draw_coordinates(coords, canvas, current_theme):
-    canvas.delete("all")
-    
-    if not coords:
-        return
-
-    # Parse the coordinates and filter out invalid ones
-    parsed_coords = [parse_coordinate(coord) for coord in coords]
-    parsed_coords = [coord for coord in parsed_coords if coord != (None, None)]
-    
-    # Check if we have valid coordinates to plot
-    if not parsed_coords:
-        return
-    
-    # Unpack latitudes and longitudes
-    lats, lons = zip(*parsed_coords)
-    max_lat = max(lats)
-    min_lat = min(lats)
-    max_lon = max(lons)
-    min_lon = min(lons)
-
-    def transform(lat, lon):
-        lon_diff = max_lon - min_lon if max_lon != min_lon else 1e-5
-        lat_diff = max_lat - min_lat if max_lat != min_lat else 1e-5
-
-        # Ensure the points stay within canvas bounds
-        x = (lon - min_lon) / lon_diff * (canvas.winfo_width() - 20) + 10
-        y = (max_lat - lat) / lat_diff * (canvas.winfo_height() - 20) + 10
-
-        return x, y
-
-    # Define the font for the text
-    bold_font = tkFont.Font(family="Helvetica", size=12, weight="bold")
-
-    # Get colors from current_theme
-    point_fill_color = current_theme.get('point_fill_color', current_theme['point_fill_color']) 
-    line_color = current_theme.get('line_color', current_theme['line_color'])
-    text_color = current_theme.get('text_color', current_theme['canvas_fg'])
-    line_width = current_theme.get('line_width', current_theme['line_width'])
-    text_bg_color = current_theme.get('text_bg_color', current_theme['text_bg_color'])  
-    text_bg_outline_color = current_theme.get('text_bg_outline_color', current_theme['text_bg_outline_color'])
-
-    # Define radius for the point and text background circle
-    point_radius = 5  # Radius for the point
-    text_radius = 10  # Radius for the text background circle
-
-    # Plot lines connecting points
-    for i in range(len(lats) - 1):
-        x1, y1 = transform(lats[i], lons[i])
-        x2, y2 = transform(lats[i + 1], lons[i + 1])
-        canvas.create_line(x1, y1, x2, y2, fill=line_color, width=line_width)
-
-    # Plot each point and its corresponding text with a background circle
-    for i, (lat, lon) in enumerate(zip(lats, lons)):
-        x, y = transform(lat, lon)
-        
-        # Draw a filled circle behind the text
-        canvas.create_oval(
-            x - text_radius, y - text_radius,
-            x + text_radius, y + text_radius,
-            fill=text_bg_color,
-            outline=text_bg_outline_color,
-            width=2
-        )
-        
-        # Draw the text centered on the circle
-        canvas.create_text(
-            x, y,
-            text=str(i + 1),
-            anchor=tk.CENTER,  # Center the text on (x, y)
-            fill=text_color,
-            font=bold_font
-        )
-
-    # Close the polygon by connecting the last point to the first
-    x1, y1 = transform(lats[-1], lons[-1])
-    x2, y2 = transform(lats[0], lons[0])
-    canvas.create_line(x1, y1, x2, y2, fill=line_color, width=line_width)
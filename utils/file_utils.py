@@ -0,0 +1,17 @@
+# utils/file_utils.py
+import os
+import threading
+
+def write_atomically(path, write):
+    """
+    Calls write(temporary) and moves the temporary file onto path, so a reader never
+    sees a partial file. The temporary is named after the calling thread, so threads
+    writing the same path never share one, and it is removed if write fails.
+    """
+    temporary = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        write(temporary)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
@@ -0,0 +1,91 @@
+# utils/listbox_utils.py
+import tkinter as tk
+
+class VirtualListbox:
+    """
+    A Listbox showing a window of `rows` lines over any number of items: only the
+    visible slice items[offset:offset + rows] is ever inserted, and the scrollbar,
+    mouse wheel and arrow keys move the offset, so thousands of items cost no more
+    than a screenful. Place it with self.frame.
+    """
+    def __init__(self, parent, rows, format_item=str, **listbox_options):
+        self.rows = rows
+        self.format_item = format_item
+        self.items = []
+        self.offset = 0
+        self.selected = None  # Index into items of the selected row
+
+        self.frame = tk.Frame(parent)
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.listbox = tk.Listbox(self.frame, height=rows, activestyle="none", exportselection=False,
+                                  **listbox_options)
+        self.listbox.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.listbox.bind("<<ListboxSelect>>", self.on_select)
+        self.listbox.bind("<MouseWheel>", self.on_wheel)
+        self.listbox.bind("<Button-4>", self.on_wheel)
+        self.listbox.bind("<Button-5>", self.on_wheel)
+        self.listbox.bind("<Up>", lambda event: self.move_selection(-1))
+        self.listbox.bind("<Down>", lambda event: self.move_selection(1))
+        self.listbox.bind("<Prior>", lambda event: self.move_selection(-self.rows))
+        self.listbox.bind("<Next>", lambda event: self.move_selection(self.rows))
+
+    def set_items(self, items):
+        self.items = items
+        self.offset = 0
+        self.selected = None
+        self.refresh()
+
+    def refresh(self):
+        self.listbox.delete(0, tk.END)
+        visible = self.items[self.offset:self.offset + self.rows]
+        if visible:
+            self.listbox.insert(tk.END, *(self.format_item(item) for item in visible))
+        if self.selected is not None and 0 <= self.selected - self.offset < len(visible):
+            self.listbox.selection_set(self.selected - self.offset)
+        if self.items:
+            self.scrollbar.set(self.offset / len(self.items), min(1.0, (self.offset + self.rows) / len(self.items)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, offset):
+        offset = max(0, min(offset, len(self.items) - self.rows))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", count, "units" | "pages")."""
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.rows if args[2] == "pages" else 1)
+            self.scroll_to(self.offset + step)
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.offset - 3)
+        else:
+            self.scroll_to(self.offset + 3)
+        return "break"
+
+    def on_select(self, event=None):
+        selection = self.listbox.curselection()
+        if selection:
+            self.selected = self.offset + selection[0]
+
+    def move_selection(self, step):
+        if self.items:
+            current = self.offset - 1 if self.selected is None and step > 0 else self.selected or 0
+            self.selected = max(0, min(current + step, len(self.items) - 1))
+            if self.selected < self.offset:
+                self.offset = self.selected
+            elif self.selected >= self.offset + self.rows:
+                self.offset = self.selected - self.rows + 1
+            self.refresh()
+        return "break"
+
+    def selected_item(self):
+        return self.items[self.selected] if self.selected is not None else None
@@ -0,0 +1,116 @@
+# utils/search_utils.py
+import numpy as np
+import pandas as pd
+
+NGRAM = 3
+
+def ngrams(text):
+    """The distinct n-grams of text, or none if it is shorter than NGRAM."""
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+def _cell_text(value):
+    # Empty cells never match, whatever pandas would print for them
+    return "" if pd.isna(value) else str(value).lower()
+
+class TextIndex:
+    """
+    Trigram inverted index over one text column: each trigram maps to the sorted ids
+    of the rows containing it. A substring query of three characters or more is
+    answered by intersecting the postings of its trigrams, shortest first, and
+    checking the few surviving candidates; shorter queries scan the texts once and
+    keep the ids for the next time. A query that extends the previous one (contains
+    it) only filters the previous hits, as happens with every keystroke of a live search.
+    Queries are plain text, not regular expressions: "." or "(" match themselves.
+    """
+    def __init__(self, texts):
+        self.texts = texts
+        postings = {}
+        for row_id, text in enumerate(texts):
+            for gram in ngrams(text):
+                postings.setdefault(gram, []).append(row_id)
+        self.postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self.short_queries = {}  # Query shorter than NGRAM -> ids of the rows containing it
+        self.reset()
+
+    def reset(self):
+        """Forgets the previous query, so the next one is not narrowed from its hits."""
+        self.last_query = ""
+        self.last_ids = []
+
+    def candidates(self, query):
+        """Sorted ids of the rows that contain every trigram of query."""
+        lists = []
+        for gram in ngrams(query):
+            ids = self.postings.get(gram)
+            if ids is None:
+                return np.empty(0, dtype=np.int32)
+            lists.append(ids)
+        lists.sort(key=len)
+        ids = lists[0]
+        for other in lists[1:]:
+            if len(ids) == 0:
+                break
+            ids = np.intersect1d(ids, other, assume_unique=True)
+        return ids
+
+    def search(self, query):
+        """Sorted ids of the rows whose text contains query (already lowercase)."""
+        texts = self.texts
+        if self.last_query and self.last_query in query:
+            ids = [row_id for row_id in self.last_ids if query in texts[row_id]]
+        elif len(query) < NGRAM:
+            if query not in self.short_queries:
+                self.short_queries[query] = [row_id for row_id, text in enumerate(texts) if query in text]
+            ids = self.short_queries[query]
+        else:
+            ids = [row_id for row_id in self.candidates(query).tolist() if query in texts[row_id]]
+        self.last_query, self.last_ids = query, ids
+        return ids
+
+class AbbreviationIndex:
+    """
+    Search index of a workbook's abbreviation sheets, built once per workbook load:
+    every row of every sheet gets an id, in sheet order, and columns 0 (abbreviation)
+    and 1 (decoded text) each get a TextIndex over their lowercase text.
+    """
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.rows = []  # (abbreviation, decoded, sheet name) per row id
+        self.sheet_positions = []  # Position of the row's sheet in the workbook
+        abbr_texts, decoded_texts = [], []
+        for position, (sheet_name, sheet_df) in enumerate(sheets.items()):
+            if sheet_df.shape[1] < 2:
+                continue
+            abbrs = sheet_df.iloc[:, 0].tolist()
+            decodeds = sheet_df.iloc[:, 1].tolist()
+            self.rows.extend(zip(abbrs, decodeds, [sheet_name] * len(abbrs)))
+            self.sheet_positions.extend([position] * len(abbrs))
+            abbr_texts.extend(_cell_text(value) for value in abbrs)
+            decoded_texts.extend(_cell_text(value) for value in decodeds)
+        self.abbr = TextIndex(abbr_texts)
+        self.decoded = TextIndex(decoded_texts)
+
+    def reset(self):
+        """Forgets the previous queries of both columns (see TextIndex.reset)."""
+        self.abbr.reset()
+        self.decoded.reset()
+
+    def search(self, abbr_text, decoded_text):
+        """
+        Rows whose abbreviation contains abbr_text or whose decoded text contains
+        decoded_text (case-insensitive), as (abbreviation, decoded, sheet name). Like the
+        per-sheet str.contains it replaces, each sheet lists its abbreviation hits and
+        then its decoded hits, so a row matching both appears twice. Unlike it, the texts
+        are matched literally (str.contains with regex=False): a query such as "a.b" or
+        "(rwy" finds those characters instead of being read as a pattern.
+        """
+        abbr_ids = self.abbr.search(abbr_text.lower()) if abbr_text else []
+        decoded_ids = self.decoded.search(decoded_text.lower()) if decoded_text else []
+        if not decoded_ids:
+            return [self.rows[row_id] for row_id in abbr_ids]
+        if not abbr_ids:
+            return [self.rows[row_id] for row_id in decoded_ids]
+        positions = self.sheet_positions
+        hits = sorted([(positions[row_id], 0, row_id) for row_id in abbr_ids] +
+                      [(positions[row_id], 1, row_id) for row_id in decoded_ids])
+        return [self.rows[row_id] for _, _, row_id in hits]
@@ -14,6 +14,7 @@ DAY_THEME = {
     'canvas_fg': 'black',
     'point_fill_color': 'blue',
     'line_color': 'red',
+    'crossing_color': 'orange',
     'text_color': 'black',
     'text_bg_color': 'white',
     'text_bg_outline_color': 'red',
@@ -33,6 +34,7 @@ NIGHT_THEME = {
     'canvas_fg': 'black',
     'point_fill_color': 'yellow',
     'line_color': 'cyan',
+    'crossing_color': 'magenta',
     'text_color': 'white',
     'text_bg_color': 'black',
     'text_bg_outline_color': 'red',
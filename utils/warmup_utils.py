@@ -0,0 +1,67 @@
+# utils/warmup_utils.py
+import queue
+import threading
+
+class WarmUp:
+    """
+    Runs slow start-up work (workbook parsing, geospatial imports, map layers) on one
+    worker thread while the window stays responsive. Results come back through a
+    queue that the Tk thread drains with root.after, so on_result handlers and
+    when_ready callbacks always run on the Tk thread and may touch widgets.
+    """
+    def __init__(self, root, poll_ms=100):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.results = {}
+        self.errors = {}
+        self._tasks = []  # (name, task, on_result) in the order they run
+        self._callbacks = {}  # name -> callbacks waiting for it
+        self._queue = queue.Queue()
+
+    def add(self, name, task, on_result=None):
+        """Queues task() under name; on_result(result) is called on the Tk thread when it succeeds."""
+        self._tasks.append((name, task, on_result))
+
+    def start(self):
+        threading.Thread(target=self._run, name="warm-up", daemon=True).start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def _run(self):
+        for name, task, _ in self._tasks:
+            try:
+                self._queue.put((name, task(), None))
+            except Exception as e:
+                self._queue.put((name, None, e))
+
+    def _poll(self):
+        while True:
+            try:
+                name, result, error = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            on_result = next(handler for task_name, _, handler in self._tasks if task_name == name)
+            if error is None:
+                self.results[name] = result
+                if on_result is not None:
+                    on_result(result)
+            else:
+                self.errors[name] = error
+                print(f"Warm-up of {name} failed: {error}")
+            for callback in self._callbacks.pop(name, []):
+                callback()
+        if len(self.results) + len(self.errors) < len(self._tasks):
+            self.root.after(self.poll_ms, self._poll)
+
+    def pending(self, name):
+        """True while the task called name is queued or running."""
+        return any(task_name == name for task_name, _, _ in self._tasks) and \
+            name not in self.results and name not in self.errors
+
+    def when_ready(self, name, callback):
+        """Calls callback on the Tk thread once name has finished, at most once per registration."""
+        if not self.pending(name):
+            callback()
+            return
+        callbacks = self._callbacks.setdefault(name, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
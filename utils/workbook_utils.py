@@ -0,0 +1,172 @@
+# utils/workbook_utils.py
+import datetime
+import hashlib
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.file_utils import write_atomically
+
+# pyarrow is imported by the readers and writers below, keeping it out of startup;
+# without it the workbook is simply parsed every time
+WORKBOOK_CACHE_DIR = "workbook_cache"  # Feather copies of the parsed workbook sheets, next to config.json
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def workbook_cache_dir(path):
+    """Cache directory of one workbook, named after its absolute path."""
+    name = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(WORKBOOK_CACHE_DIR, name)
+
+# Cell types JSON lacks, stored as {tag: text} and rebuilt by the parser;
+# pd.Timestamp and pd.Timedelta come before their base classes
+TAGGED_CELL_TYPES = (
+    ("timestamp", pd.Timestamp, pd.Timestamp.isoformat, pd.Timestamp),
+    ("datetime", datetime.datetime, datetime.datetime.isoformat, datetime.datetime.fromisoformat),
+    ("date", datetime.date, datetime.date.isoformat, datetime.date.fromisoformat),
+    ("time", datetime.time, datetime.time.isoformat, datetime.time.fromisoformat),
+    ("pd_timedelta", pd.Timedelta, pd.Timedelta.isoformat, pd.Timedelta),
+    ("timedelta", datetime.timedelta, lambda value: pd.Timedelta(value).isoformat(),
+     lambda text: pd.Timedelta(text).to_pytimedelta()),
+)
+
+def _tag_cell(value):
+    """json.dumps default for cells and column names JSON cannot store as they are."""
+    if value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    for tag, cell_type, to_text, _ in TAGGED_CELL_TYPES:
+        if isinstance(value, cell_type):
+            return {tag: to_text(value)}
+    return {"str": str(value)}  # Anything else keeps its text
+
+def _untag_cell(obj):
+    """json.loads object_hook reversing _tag_cell; other objects (the manifest's own) pass through."""
+    if len(obj) == 1:
+        (tag, text), = obj.items()
+        if tag == "str":
+            return text
+        for cell_tag, _, _, parse in TAGGED_CELL_TYPES:
+            if cell_tag == tag:
+                return parse(text)
+    return obj
+
+def _encode_json_cell(value):
+    return json.dumps(None if isinstance(value, float) and math.isnan(value) else value, default=_tag_cell)
+
+def _decode_json_cell(cell):
+    return float("nan") if cell == "null" else json.loads(cell, object_hook=_untag_cell)
+
+def _encode_sheet(df, pa):
+    """
+    The sheet with string column names "0", "1", ... as Arrow needs, and the names of
+    object columns mixing types (say text, numbers and dates), stored as JSON text per
+    cell with dates and times tagged.
+    """
+    df = df.copy()
+    df.columns = [str(i) for i in range(df.shape[1])]
+    json_columns = []
+    for name in df.columns:
+        if df[name].dtype == object:
+            try:
+                pa.array(df[name], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df[name] = df[name].map(_encode_json_cell)
+                json_columns.append(name)
+    return df, json_columns
+
+def _decode_sheet(df, columns, json_columns):
+    for name in df.columns:
+        if name in json_columns:
+            df[name] = df[name].map(_decode_json_cell)
+        elif df[name].dtype == object:
+            # Arrow hands back empty cells as None; read_excel gives NaN
+            df[name] = df[name].where(df[name].notna(), float("nan"))
+    df.columns = pd.Index(columns) if columns else pd.RangeIndex(0)  # read_excel's columns for a blank sheet
+    return df
+
+def read_workbook_cache(path):
+    """
+    The cached sheets of the workbook at path, or None if there is no cache or the file
+    changed. Size must match; an equal mtime is trusted, otherwise the SHA-256 decides
+    (and a match refreshes the recorded mtime).
+    """
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+    directory = workbook_cache_dir(path)
+    manifest_path = os.path.join(directory, "manifest.json")
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file, object_hook=_untag_cell)
+        stat = os.stat(path)
+        if stat.st_size != manifest["size"]:
+            return None
+        if stat.st_mtime != manifest["mtime"]:
+            if file_sha256(path) != manifest["sha256"]:
+                return None
+            manifest["mtime"] = stat.st_mtime
+            _write_manifest(manifest, manifest_path)
+
+        sheets = {}
+        for sheet in manifest["sheets"]:
+            df = feather.read_table(os.path.join(directory, sheet["file"]), memory_map=True).to_pandas()
+            sheets[sheet["name"]] = _decode_sheet(df, sheet["columns"], sheet["json_columns"])
+        return sheets
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Could not read workbook cache {directory}: {e}")
+        return None
+
+def write_workbook_cache(path, sheets):
+    """
+    Saves the parsed sheets of the workbook at path. Every file is written atomically;
+    sheet files carry the workbook hash and the manifest is replaced last, so a reader
+    never mixes two versions. Sheet files left by a failed write are not in any
+    manifest and the next successful write removes them.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError:
+        return
+    directory = workbook_cache_dir(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        stat = os.stat(path)
+        sha256 = file_sha256(path)
+        manifest = {"source": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime,
+                    "sha256": sha256, "sheets": []}
+        for i, (name, df) in enumerate(sheets.items()):
+            encoded, json_columns = _encode_sheet(df, pa)
+            file_name = f"{sha256[:16]}.{i}.feather"
+            write_atomically(os.path.join(directory, file_name),
+                             lambda temporary: feather.write_feather(encoded, temporary))
+            manifest["sheets"].append({"name": name, "file": file_name,
+                                       "columns": list(df.columns), "json_columns": json_columns})
+        _write_manifest(manifest, os.path.join(directory, "manifest.json"))
+
+        current = {sheet["file"] for sheet in manifest["sheets"]} | {"manifest.json"}
+        for file_name in os.listdir(directory):
+            if file_name not in current:
+                os.remove(os.path.join(directory, file_name))
+    except Exception as e:
+        print(f"Could not write workbook cache {directory}: {e}")
+
+def _write_manifest(manifest, manifest_path):
+    def write(temporary):
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=4, default=_tag_cell)
+
+    write_atomically(manifest_path, write)
@@ -2,7 +2,10 @@
 import tkinter as tk
 import tkinter.font as tkFont
 from utils.clipboard_utils import paste_from_clipboard
-from utils.drawing_utils import show_on_map, draw_coordinates
+from utils.coordinate_utils import as_coordinate_set
+from utils.listbox_utils import VirtualListbox
+from utils.search_utils import AbbreviationIndex
+from utils.workbook_utils import read_workbook_cache, write_workbook_cache
 import re
 from tkinter import messagebox, filedialog
 import pandas as pd
@@ -12,11 +15,18 @@ import sys
 import math
 
 CONFIG_FILE = "config.json"
+SEARCH_DELAY_MS = 200  # Pause in typing before the live abbreviation search runs
+SEARCH_RESULT_ROWS = 8
 excel_file = None  # Global variable for the Excel file
 excel_data = None
+workbook_cache = {}  # Workbook path -> (mtime, sheets) of the last parse
+search_index = None  # AbbreviationIndex of excel_data, see get_search_index
+abbreviation_search = None  # AbbreviationSearch of the INO tool view on screen
 
 # Global variable for extreme coordinates
 extremities_str = ""
+# Coordinate sets parsed by the last paste, reused by "Show on map"
+pasted_sets = {}
 
 def prompt_for_excel_file():
     """Prompt the user to select the Excel file if it's not found or not specified."""
@@ -49,17 +59,94 @@ def get_resource_path(file_name):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, file_name)
 
-def load_excel_data(file_path):
-    """Load the Excel data from the given file path."""
+def read_workbook(file_path, use_cache=True):
+    """
+    All sheets of the workbook, from its Feather copy in WORKBOOK_CACHE_DIR while that
+    still matches the file; otherwise parsed with pandas and saved there for next time.
+    """
+    sheets = read_workbook_cache(file_path) if use_cache else None
+    if sheets is None:
+        sheets = pd.read_excel(file_path, sheet_name=None)
+        if sheets:
+            write_workbook_cache(file_path, sheets)
+    return sheets
+
+def load_excel_data(file_path, reload=False):
+    """
+    Load the Excel data from the given file path. The parsed sheets are kept in
+    workbook_cache and reused until the file's mtime changes; reload parses the
+    workbook again regardless of both caches.
+    """
     try:
-        excel_data = pd.read_excel(file_path, sheet_name=None)
+        mtime = os.path.getmtime(file_path)
+        cached = workbook_cache.get(file_path)
+        if cached is not None and cached[0] == mtime and not reload:
+            return cached[1]
+        excel_data = read_workbook(file_path, use_cache=not reload)
         if excel_data is None or not excel_data:
             raise ValueError("Failed to load any data from the Excel file.")
+        workbook_cache[file_path] = (mtime, excel_data)
         return excel_data
     except Exception as e:
         messagebox.showerror("Error", f"Failed to load Excel file: {e}")
         return None
 
+def reload_excel_data():
+    """Re-parses the current workbook even if its mtime is unchanged."""
+    global excel_data, search_index
+    data = load_excel_data(excel_file, reload=True)
+    if data is not None:
+        excel_data = data
+        search_index = None
+        if abbreviation_search is not None:
+            abbreviation_search.refresh()  # The hits on screen came from the old workbook
+        messagebox.showinfo("Reload data", f"Loaded {len(data)} sheets from {os.path.basename(excel_file)}.")
+
+def preload_excel_data():
+    """
+    Parses and indexes the configured workbook off the Tk thread, returning
+    (path, mtime, data, index), or None if no workbook is configured yet; errors
+    propagate to the warm-up worker.
+    """
+    file_path = load_config().get("excel_file_path")
+    if not file_path or not os.path.exists(file_path):
+        return None
+    mtime = os.path.getmtime(file_path)
+    data = read_workbook(file_path)
+    return file_path, mtime, data, AbbreviationIndex(data) if data else None
+
+def use_preloaded_excel(result):
+    """Adds the warm-up worker's workbook to workbook_cache and its index for show_ino_tool."""
+    global search_index
+    if result is not None and result[2]:
+        file_path, mtime, data, search_index = result
+        workbook_cache[file_path] = (mtime, data)
+
+def get_search_index():
+    """The AbbreviationIndex of excel_data, built once per workbook load."""
+    global search_index
+    if search_index is None or search_index.sheets is not excel_data:
+        search_index = AbbreviationIndex(excel_data)
+    return search_index
+
+def preload_map():
+    """Imports the map stack, converts stale layer sidecars and loads the layers and airports off the Tk thread."""
+    from utils.drawing_utils import build_layer_sidecars, load_airport_store, load_base_labels
+    build_layer_sidecars()
+    load_base_labels()
+    load_airport_store()
+
+def preload_map_tiles():
+    """Renders the coarse base map tiles not on disk yet off the Tk thread (slow only on first run)."""
+    from utils.drawing_utils import base_map_tiles
+    base_map_tiles.build()
+
+def show_on_map(original_coords, sorted_coords):
+    """Opens the map window, importing the map and geospatial stack on the first call."""
+    # drawing_utils loads matplotlib, geopandas, cartopy and GDAL; keep them out of startup
+    from utils.drawing_utils import show_on_map as show_map_window
+    show_map_window(original_coords, sorted_coords)
+
 def copy_to_clipboard(root, text, button):
     """Copies text to the clipboard and updates the button to indicate success."""
     root.clipboard_clear()
@@ -74,6 +161,14 @@ def add_line_numbers_to_text_widget(text_widget):
         numbered_line = f"{i+1}. {line}"
         text_widget.insert(tk.END, numbered_line + '\n', 'right_align')
 
+def get_coordinate_set(text_widget, name):
+    """Return the pasted CoordinateSet for a text widget, re-parsing only if the text was edited."""
+    coords = [line.partition('. ')[2] for line in text_widget.get("1.0", "end-1c").split('\n') if line]
+    coordinate_set = pasted_sets.get(name)
+    if coordinate_set is not None and coordinate_set.coords == coords:
+        return coordinate_set
+    return as_coordinate_set(coords)
+
 def get_text_without_line_numbers(text_widget):
     """Retrieve text from a text widget, stripping line numbers."""
     text = text_widget.get("1.0", tk.END).strip()
@@ -209,126 +304,82 @@ def calculate_new_coordinate(start_coord, radial, distance_nm, result_entry):
     # print(new_coord)
     return new_coord
 
-def search_abbreviation(abbr_text, decoded_text, root, current_theme):
-    """Perform search and display results in a modal pop-up window."""
-    try:
-        results = []
-
-        abbr_text = abbr_text.lower()
-        decoded_text = decoded_text.lower()
-
-        for sheet_name, sheet_df in excel_data.items():
-            if abbr_text:
-                matches = sheet_df[sheet_df.iloc[:, 0].astype(str).str.lower().str.contains(abbr_text, na=False)]
-                results.extend((row.iloc[0], row.iloc[1], sheet_name) for _, row in matches.iterrows())
-
-            if decoded_text:
-                matches = sheet_df[sheet_df.iloc[:, 1].astype(str).str.lower().str.contains(decoded_text, na=False)]
-                results.extend((row.iloc[0], row.iloc[1], sheet_name) for _, row in matches.iterrows())
-
-        # If no results found, show a message and return
-        if not results:
-            messagebox.showinfo("No Results", "No matches found.")
+def format_search_result(result):
+    abbr, decoded, sheet_name = result
+    return f"{abbr}  -  {decoded}  ({sheet_name})"
+
+class AbbreviationSearch:
+    """
+    Search-as-you-type for the Abbr. and Decoded entries. Keystrokes are debounced
+    through root.after, the query runs against the workbook's AbbreviationIndex
+    (which narrows the previous hits when a query is extended) and the hits go into
+    one VirtualListbox under the entries. Double-click, Enter or Copy copies the
+    selected decoded text in brackets.
+    """
+    def __init__(self, root, parent, abbr_entry, decoded_entry, current_theme):
+        self.root = root
+        self.abbr_entry = abbr_entry
+        self.decoded_entry = decoded_entry
+        self.search_job = None
+        self.last_query = ("", "")
+
+        self.status_label = tk.Label(parent, text="", bg=current_theme['bg'], fg=current_theme['fg'])
+        self.status_label.grid(row=2, column=0, columnspan=2, padx=5, sticky="w")
+        self.copy_button = tk.Button(parent, text="Copy", command=self.copy_selected,
+                                     bg=current_theme['button_bg'], fg=current_theme['fg'])
+        self.copy_button.grid(row=2, column=2, pady=5, sticky="e")
+        self.results = VirtualListbox(parent, SEARCH_RESULT_ROWS, format_item=format_search_result, width=60,
+                                      bg=current_theme['bg'], fg=current_theme['fg'])
+        self.results.frame.grid(row=3, column=0, columnspan=3, padx=5, pady=5, sticky="nsew")
+        self.results.listbox.bind("<Double-Button-1>", self.copy_selected)
+        self.results.listbox.bind("<Return>", self.copy_selected)
+
+        for entry in (abbr_entry, decoded_entry):
+            entry.bind("<KeyRelease>", self.schedule_search)
+            entry.bind("<Return>", lambda event: self.search(force=True))
+        # Leaving the view destroys the entries; a debounced search must not outlive them
+        abbr_entry.bind("<Destroy>", self.cancel_search, add="+")
+
+    def schedule_search(self, event=None):
+        self.cancel_search()
+        self.search_job = self.root.after(SEARCH_DELAY_MS, self.search)
+
+    def cancel_search(self, event=None):
+        if self.search_job is not None:
+            self.root.after_cancel(self.search_job)
+            self.search_job = None
+
+    def search(self, force=False):
+        """Runs the query now; unless forced, an unchanged query keeps the current hits."""
+        self.cancel_search()
+        if not self.abbr_entry.winfo_exists():
+            return  # The view was closed, e.g. before a Reload data refresh
+        query = (self.abbr_entry.get(), self.decoded_entry.get())
+        if query == self.last_query and not force:
+            return  # Keys that do not edit the text, such as arrows and Shift
+        self.last_query = query
+        if not any(query):
+            self.results.set_items([])
+            self.status_label.config(text="")
             return
+        try:
+            results = get_search_index().search(*query)
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred during search: {e}")
+            return
+        self.results.set_items(results)
+        self.status_label.config(text=f"{len(results)} matches" if results else "No matches found.")
 
-        # Open a modal pop-up window
-        result_popup = tk.Toplevel(root)
-        result_popup.title("Search Results")
-
-        # Set the background color for dark mode
-        result_popup.configure(bg=current_theme['bg'])
-
-        # Set a minimum width for the modal window
-        result_popup.geometry("900x300")  # Adjust this size if necessary to fit the results and button
-
-        # Create a scrollable frame in the pop-up
-        canvas = tk.Canvas(
-            result_popup,
-            highlightbackground=current_theme['highlightbackground'],
-            highlightthickness=2,
-            relief="raised",
-            bg=current_theme['bg']
-        )
-        scrollbar = tk.Scrollbar(result_popup, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(
-            canvas,
-            highlightbackground=current_theme['highlightbackground'],
-            highlightthickness=2,
-            relief="raised",
-            bg=current_theme['bg']
-        )
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        # Create result widgets inside the scrollable frame
-        for i, (abbr, decoded, sheet_name) in enumerate(results):
-            create_result_widgets(scrollable_frame, i, abbr, decoded, sheet_name, root, current_theme)
-
-    except Exception as e:
-        messagebox.showerror("Error", f"An error occurred during search: {e}")
-
-def create_result_widgets(result_frame, index, abbr, decoded, sheet_name, root, current_theme):
-    """Create and place result widgets in the result frame (now in the pop-up)."""
-
-    # Create a frame to hold multiple labels for better formatting
-    widget_frame = tk.Frame(result_frame, bg=current_theme['bg'])
-    widget_frame.grid(row=2 * index, column=0, sticky="w", padx=5, pady=2)
-
-    # Abbreviation Label
-    abbr_label = tk.Label(widget_frame, text=f"Abbr: {abbr}, ", bg=current_theme['bg'], fg=current_theme['fg'])
-    abbr_label.pack(side="left")
-
-    # Decoded Label
-    decoded_label = tk.Label(widget_frame, text=f"Decoded: {decoded}, ", bg=current_theme['bg'], fg=current_theme['fg'])
-    decoded_label.pack(side="left")
-
-    # Source Label (with "Source:" in bold)
-    source_label = tk.Label(widget_frame, text="Source: ", bg=current_theme['bg'], fg=current_theme['fg'], font=("TkDefaultFont", 10, "bold"))
-    source_label.pack(side="left")
-
-    # Sheet Name Label (following the "Source:" label)
-    sheet_name_label = tk.Label(widget_frame, text=sheet_name, bg=current_theme['bg'], fg=current_theme['fg'])
-    sheet_name_label.pack(side="left")
-
-    def on_copy():
-        # Copy the text to the clipboard
-        copy_to_clipboard(root, f"({decoded})", None)
-        # Close the pop-up window
-        result_frame.winfo_toplevel().destroy()
-
-    copy_button = tk.Button(
-        result_frame,
-        text="Copy",
-        command=on_copy,
-        bg=current_theme['button_bg'],
-        fg=current_theme['fg']
-    )
-    copy_button.grid(row=2 * index, column=1, padx=5)
-
-
-    def on_copy():
-        # Copy the text to the clipboard
-        copy_to_clipboard(root, f"({decoded})", None)
-        # Close the pop-up window
-        result_frame.winfo_toplevel().destroy()
+    def refresh(self):
+        """Re-runs the current query from scratch, for when the workbook and its index were replaced."""
+        get_search_index().reset()
+        self.last_query = ("", "")
+        self.search(force=True)
 
-    copy_button = tk.Button(
-        result_frame,
-        text="Copy",
-        command=on_copy,
-        bg=current_theme['button_bg'],
-        fg=current_theme['fg']
-    )
-    copy_button.grid(row=2 * index, column=1, padx=5)
+    def copy_selected(self, event=None):
+        result = self.results.selected_item()
+        if result is not None:
+            copy_to_clipboard(self.root, f"({result[1]})", None)
 
 # Flight level calculation
 def calculate_flight_level(nof_entry, uom_var, height_entry, result_entry, root):
@@ -472,7 +523,7 @@ def bind_paste_shortcuts(root, paste_and_add_line_numbers):
     root.bind_all("<Control-P>", on_paste_event)
 
 def show_ino_tool(root, main_frame, current_theme):
-    global excel_file, excel_data
+    global excel_file, excel_data, abbreviation_search
     root.title("EAD OPS Tool - INO OPS Tool")
 
     # Clear the main frame
@@ -488,7 +539,7 @@ def show_ino_tool(root, main_frame, current_theme):
         config["excel_file_path"] = excel_file
         save_config(config)
 
-    excel_data = load_excel_data(excel_file)  # Load the Excel data
+    excel_data = load_excel_data(excel_file)  # Parsed once per workbook change, see workbook_cache
     if excel_data is None:
         return  # Stop if there's an error loading the data
 
@@ -542,12 +593,18 @@ def show_ino_tool(root, main_frame, current_theme):
             num_coords = len(text.split('\n'))
         else:
             num_coords = 0
-        original_label.config(text=f"Original COORDs: {num_coords}")
+        label_text = f"Original COORDs: {num_coords}"
+        # Flag whether the pasted order already forms a simple polygon
+        original_set = get_coordinate_set(original_text, 'original')
+        if len(original_set) > 2:
+            num_crossings = len(original_set.crossings())
+            label_text += f", {num_crossings} crossings" if num_crossings else ", simple"
+        original_label.config(text=label_text)
 
     # Function to paste and add line numbers
     def paste_and_add_line_numbers():
         global extremities_str
-        extremities_str = paste_from_clipboard(
+        extremities_str, pasted_sets['original'], pasted_sets['sorted'] = paste_from_clipboard(
             root,
             source_text,
             original_text=original_text,
@@ -559,6 +616,18 @@ def show_ino_tool(root, main_frame, current_theme):
         add_line_numbers_to_text_widget(original_text)
         add_line_numbers_to_text_widget(sorted_text)
         update_coord_count()
+        update_sorted_label(pasted_sets['sorted'])
+
+    # Function to show which ordering strategy produced the sorted coordinates
+    def update_sorted_label(sorted_set):
+        ordering = sorted_set.ordering
+        if ordering is None:
+            sorted_label.config(text="Sorted COORDs")
+            return
+        text = f"Sorted COORDs: {ordering.strategy.replace('_', ' ')}, {ordering.seconds * 1000:.0f} ms"
+        if not ordering.is_simple:
+            text += " (crossing)"
+        sorted_label.config(text=text)
 
     # Paste COORD button
     paste_coord_button = tk.Button(input_frame, text="Paste & Format COORD", command=paste_and_add_line_numbers,
@@ -712,9 +781,14 @@ def show_ino_tool(root, main_frame, current_theme):
     abbr_entry = create_entry_with_label(abbreviation_frame, "Abbr.", 15, 0, 0)
     decoded_entry = create_entry_with_label(abbreviation_frame, "Decoded", 15, 1, 0)
 
-    search_button = tk.Button(abbreviation_frame, text="Search", command=lambda: search_abbreviation(abbr_entry.get(), decoded_entry.get(), root, current_theme))
+    abbreviation_search = AbbreviationSearch(root, abbreviation_frame, abbr_entry, decoded_entry, current_theme)
+
+    search_button = tk.Button(abbreviation_frame, text="Search", command=lambda: abbreviation_search.search(force=True))
     search_button.grid(row=1, column=2, pady=5, sticky="e")
 
+    reload_button = tk.Button(abbreviation_frame, text="Reload data", command=reload_excel_data)
+    reload_button.grid(row=0, column=2, pady=5, sticky="e")
+
     # Abbreviation result frame
     # result_frame = tk.Frame(frame)
     # result_frame.grid(row=4, column=0, padx=5, pady=5, sticky="nsew")
@@ -727,8 +801,8 @@ def show_ino_tool(root, main_frame, current_theme):
 
     # Show on map button
     show_map_button = tk.Button(column_one_frame, text="Show on map", command=lambda: show_on_map(
-        [coord.partition('. ')[2] for coord in original_text.get("1.0", "end-1c").split('\n') if coord],
-        [coord.partition('. ')[2] for coord in sorted_text.get("1.0", "end-1c").split('\n') if coord]
+        get_coordinate_set(original_text, 'original'),
+        get_coordinate_set(sorted_text, 'sorted')
     ))
     show_map_button.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
 